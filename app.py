@@ -4,21 +4,80 @@ Resume Builder GPT - Streamlit App
 Step-by-step resume optimization workflow using GPT.
 """
 
+import copy
+import hashlib
+import io
+import json
 import os
+import re
+import traceback
+from collections import Counter
+from itertools import chain
 import streamlit as st
 from dotenv import load_dotenv
-from utils.latex_extractor import extract_from_latex, extract_from_latex_string
-from utils.llm_jd import extract_and_analyze_jd
-from utils.llm_resume import rewrite_bullets, suggest_skills
-from utils.latex_editor import update_latex_resume
+
+# utils/* modules pull in openai, requests and bs4, so each step imports
+# only what it needs to keep the first page render fast
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Single-pass scanner for the Step 2 debug panel: section names and command counts
+_DEBUG_SCAN = re.compile(r'\\(?:(section)\*?(?:\{([^}]+)\})?|(resumeSubheading|resumeItem|item))')
+
+# Shared read-only default for dict.get() lookups of list fields
+_EMPTY = ()
+
+# Separators accepted between skills in the Step 7 text areas
+_SKILL_SPLIT = re.compile(r'[,\n]+')
+
+# Workflow step titles, in order
+_STEPS = (
+    "Upload Resume",
+    "Extract Data",
+    "Input Job Description",
+    "Analyze JD",
+    "ATS Dashboard",
+    "Review Bullets",
+    "Review Skills",
+    "Generate LaTeX",
+    "Download",
+)
+
+# Static closing instructions shown in Step 9
+_WHATS_NEXT_MD = """
+### What's next?
+
+1. **Compile your LaTeX** - Use a LaTeX editor (Overleaf, TeXstudio, etc.) to generate PDF
+2. **Review the output** - Check formatting and make any final adjustments
+3. **Start a new optimization** - Click the button below to start over with a new job description
+"""
+
+# URL fetch modes with their Step 3 descriptions and Step 4 labels
+_FETCH_MODES = ("auto", "requests", "playwright")
+
+_MODE_INFO = {
+    "auto": "🔄 **Auto (Recommended)**: Tries fast HTTP fetch first. If content is short or missing, automatically uses browser rendering.",
+    "requests": "⚡ **HTTP Requests**: Fast but may fail on JavaScript-heavy sites (LinkedIn, Workday, etc.).",
+    "playwright": "🌐 **Playwright Browser**: Slower but handles all sites including JavaScript-rendered pages."
+}
+
+_MODE_LABELS = {
+    "auto": "Auto (HTTP + Playwright fallback)",
+    "requests": "HTTP Requests",
+    "playwright": "Playwright Browser"
+}
+
 
 # Validate API key at startup
+@st.cache_resource(show_spinner=False)
 def validate_api_key():
-    """Validate OPENAI_API_KEY is set. Stop app if missing."""
+    """
+    Validate OPENAI_API_KEY is set. Stop app if missing.
+    
+    Cached for the process once the key is found; a missing key stops the
+    script without being cached, so it is checked again on the next run.
+    """
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         st.error("❌ OPENAI_API_KEY environment variable is not set.")
@@ -26,29 +85,61 @@ def validate_api_key():
     return api_key
 
 
+# Default value for every session state variable
+_SESSION_DEFAULTS = {
+    'step': 1,
+    'latex_content': None,
+    'extracted_data': None,
+    'jd_analysis': None,
+    'bullet_suggestions': {},
+    'skill_suggestions': {},
+    'updated_latex': None,
+    'jd_url': None,
+    'jd_text': None,
+    'jd_fetch_mode': "auto",
+}
+
+
 # Initialize session state
 def init_session_state():
     """Initialize session state variables."""
-    if 'step' not in st.session_state:
-        st.session_state.step = 1
-    if 'latex_content' not in st.session_state:
-        st.session_state.latex_content = None
-    if 'extracted_data' not in st.session_state:
-        st.session_state.extracted_data = None
-    if 'jd_analysis' not in st.session_state:
-        st.session_state.jd_analysis = None
-    if 'bullet_suggestions' not in st.session_state:
-        st.session_state.bullet_suggestions = {}
-    if 'skill_suggestions' not in st.session_state:
-        st.session_state.skill_suggestions = {}
-    if 'updated_latex' not in st.session_state:
-        st.session_state.updated_latex = None
-    if 'jd_url' not in st.session_state:
-        st.session_state.jd_url = None
-    if 'jd_text' not in st.session_state:
-        st.session_state.jd_text = None
-    if 'jd_fetch_mode' not in st.session_state:
-        st.session_state.jd_fetch_mode = "auto"
+    for key, default in _SESSION_DEFAULTS.items():
+        # Copy so sessions never share the mutable defaults
+        st.session_state.setdefault(key, copy.copy(default))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_extract_from_latex_string(content):
+    """Extract resume data, reusing the result for identical LaTeX content."""
+    from utils.latex_extractor import extract_from_latex_string
+    return extract_from_latex_string(content)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_extract_and_analyze_jd(job_url, raw_text, fetch_mode):
+    """Analyze a job description, reusing the result for identical inputs."""
+    from utils.llm_jd import extract_and_analyze_jd
+    return extract_and_analyze_jd(job_url=job_url, raw_text=raw_text, fetch_mode=fetch_mode)
+
+
+def build_latex_preview(latex, limit=2000):
+    """Return the first `limit` characters of the LaTeX with a truncation note."""
+    if len(latex) <= limit:
+        return latex
+    return latex[:limit] + "\n\n... (truncated, full file available for download)"
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def encode_latex(latex):
+    """Encode the LaTeX for download once per generated file."""
+    return latex.encode('utf-8')
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_update_latex_resume(original_latex, updated_experiences, updated_skills):
+    """Update the LaTeX resume, reusing the result for identical edits."""
+    from utils.latex_editor import update_latex_resume
+    return update_latex_resume(original_latex, updated_experiences, updated_skills)
 
 
 # Validate API key at startup
@@ -67,20 +158,21 @@ st.title("📄 Resume Builder GPT")
 st.markdown("Optimize your LaTeX resume for ATS using AI")
 
 # Progress indicator
-steps = [
-    "Upload Resume",
-    "Extract Data",
-    "Input Job Description",
-    "Analyze JD",
-    "ATS Dashboard",
-    "Review Bullets",
-    "Review Skills",
-    "Generate LaTeX",
-    "Download"
-]
+progress = st.progress(st.session_state.step / len(_STEPS))
+st.caption(f"Step {st.session_state.step} of {len(_STEPS)}: {_STEPS[st.session_state.step - 1]}")
+
+
+def parse_skills(text):
+    """Parse skills entered one per line or comma-separated."""
+    return [s for s in (part.strip() for part in _SKILL_SPLIT.split(text)) if s]
+
 
-progress = st.progress(st.session_state.step / len(steps))
-st.caption(f"Step {st.session_state.step} of {len(steps)}: {steps[st.session_state.step - 1]}")
+def get_skill_inputs():
+    """Return (existing_skills, jd_skills) for skill suggestions."""
+    existing_skills = st.session_state.extracted_data.get('skills', [])
+    jd_skills = st.session_state.jd_analysis.get('required_skills', []) + \
+               st.session_state.jd_analysis.get('tools_technologies', [])
+    return existing_skills, jd_skills
 
 
 def go_to_step(step_num):
@@ -91,14 +183,19 @@ def go_to_step(step_num):
 
 def reset_to_home():
     """Reset all session state and go to step 1."""
-    for key in list(st.session_state.keys()):
-        del st.session_state[key]
+    st.session_state.clear()
     st.session_state.step = 1
     st.rerun()
 
 
+@st.fragment
 def render_navigation(current_step, show_home=True, show_back=True, back_step=None):
-    """Render navigation buttons at the top of each step."""
+    """
+    Render navigation buttons at the top of each step.
+    
+    Runs as a fragment so the nav widgets are not rebuilt on unrelated reruns;
+    go_to_step/reset_to_home call st.rerun(), which reruns the full app.
+    """
     if current_step == 1:
         return  # No navigation on first step
     
@@ -129,12 +226,14 @@ if st.session_state.step == 1:
     )
     
     if uploaded_file is not None:
-        # Read file content
-        latex_content = uploaded_file.read().decode('utf-8')
+        # Read file content, decoding as we go instead of buffering the raw bytes
+        reader = io.TextIOWrapper(uploaded_file, encoding='utf-8', errors='replace')
+        latex_content = reader.read()
+        reader.detach()  # Leave the uploaded file open for Streamlit
         st.session_state.latex_content = latex_content
         
         st.success("✅ Resume uploaded successfully!")
-        st.code(latex_content[:500] + "..." if len(latex_content) > 500 else latex_content, language='latex')
+        st.code(latex_content[:500] + ("..." if len(latex_content) > 500 else ""), language='latex')
         
         if st.button("Next: Extract Data", type="primary"):
             st.session_state.step = 2
@@ -150,9 +249,17 @@ if st.session_state.step == 2:
     else:
         with st.spinner("Extracting experience bullets and skills..."):
             try:
-                # Extract data directly from string content
-                extracted_data = extract_from_latex_string(st.session_state.latex_content)
-                st.session_state.extracted_data = extracted_data
+                # Extract data directly from string content, unless it was
+                # already extracted from this exact content
+                latex_hash = hashlib.blake2b(
+                    st.session_state.latex_content.encode('utf-8'), digest_size=16
+                ).hexdigest()
+                if st.session_state.get('_latex_hash') == latex_hash and st.session_state.extracted_data:
+                    extracted_data = st.session_state.extracted_data
+                else:
+                    extracted_data = cached_extract_from_latex_string(st.session_state.latex_content)
+                    st.session_state.extracted_data = extracted_data
+                    st.session_state._latex_hash = latex_hash
                 
                 # Check if extraction was successful
                 has_experiences = bool(extracted_data.get('experiences'))
@@ -171,11 +278,13 @@ if st.session_state.step == 2:
                     if extracted_data['experiences']:
                         for exp_key, exp_data in extracted_data['experiences'].items():
                             with st.expander(f"{exp_data['role']} at {exp_data['company']}", expanded=True):
-                                st.write(f"**Date:** {exp_data.get('date', 'N/A')}")
-                                st.write(f"**Location:** {exp_data.get('location', 'N/A')}")
-                                st.write(f"**Bullets ({len(exp_data.get('bullets', []))}):**")
-                                for bullet in exp_data.get('bullets', []):
-                                    st.write(f"- {bullet}")
+                                bullets = exp_data.get('bullets', _EMPTY)
+                                st.markdown(
+                                    f"**Date:** {exp_data.get('date', 'N/A')}\n\n"
+                                    f"**Location:** {exp_data.get('location', 'N/A')}\n\n"
+                                    f"**Bullets ({len(bullets)}):**\n\n"
+                                    + "\n".join(f"- {bullet}" for bullet in bullets)
+                                )
                     else:
                         st.warning("No experiences found.")
                         st.info("💡 Expected format: `\\resumeSubheading{Role}{Company}{Date}{Location}`")
@@ -183,8 +292,7 @@ if st.session_state.step == 2:
                 with col2:
                     st.subheader("🛠️ Skills")
                     if extracted_data['skills']:
-                        for skill in extracted_data['skills']:
-                            st.write(f"• {skill}")
+                        st.markdown("\n".join(f"- {skill}" for skill in extracted_data['skills']))
                     else:
                         st.warning("No skills found.")
                         st.info("💡 Expected format: `\\resumeItem{Skill}` or `\\item Skill`")
@@ -202,28 +310,34 @@ if st.session_state.step == 2:
                     # Check for common patterns
                     content = st.session_state.latex_content
                     st.write("**Detected patterns:**")
-                    if '\\section' in content:
-                        import re
-                        sections = re.findall(r'\\section\*?\{([^}]+)\}', content)
+                    # Scan the content once for every pattern of interest
+                    counts = Counter()
+                    sections = []
+                    for match in _DEBUG_SCAN.finditer(content):
+                        if match.group(1):
+                            counts['section'] += 1
+                            if match.group(2) is not None:
+                                sections.append(match.group(2))
+                        else:
+                            counts[match.group(3)] += 1
+                    
+                    if counts['section']:
                         st.write(f"- Sections found: {sections}")
                     else:
                         st.write("- No `\\section` commands found")
                     
-                    if '\\resumeSubheading' in content:
-                        count = content.count('\\resumeSubheading')
-                        st.write(f"- `\\resumeSubheading` found: {count} times")
+                    if counts['resumeSubheading']:
+                        st.write(f"- `\\resumeSubheading` found: {counts['resumeSubheading']} times")
                     else:
                         st.write("- No `\\resumeSubheading` commands found")
                     
-                    if '\\resumeItem' in content:
-                        count = content.count('\\resumeItem')
-                        st.write(f"- `\\resumeItem` found: {count} times")
+                    if counts['resumeItem']:
+                        st.write(f"- `\\resumeItem` found: {counts['resumeItem']} times")
                     else:
                         st.write("- No `\\resumeItem` commands found")
                     
-                    if '\\item' in content:
-                        count = content.count('\\item')
-                        st.write(f"- `\\item` found: {count} times")
+                    if counts['item']:
+                        st.write(f"- `\\item` found: {counts['item']} times")
                 
                 # Allow proceeding even with partial data
                 if st.button("Next: Input Job Description", type="primary"):
@@ -233,7 +347,6 @@ if st.session_state.step == 2:
                     st.rerun()
                     
             except Exception as e:
-                import traceback
                 st.error(f"❌ Error extracting data: {str(e)}")
                 with st.expander("🔧 Error Details"):
                     st.code(traceback.format_exc())
@@ -266,22 +379,23 @@ if st.session_state.step == 3:
             st.markdown("**Select Fetch Mode:**")
             fetch_mode = st.radio(
                 "How should we extract content from the URL?",
-                options=["auto", "requests", "playwright"],
-                index=["auto", "requests", "playwright"].index(st.session_state.jd_fetch_mode),
+                options=_FETCH_MODES,
+                index=_FETCH_MODES.index(st.session_state.jd_fetch_mode),
                 horizontal=True,
                 help="Auto: Tries HTTP first, falls back to browser. Requests: Fast HTTP only. Playwright: Browser rendering (slower but handles JavaScript)."
             )
             st.session_state.jd_fetch_mode = fetch_mode
             
             # Mode descriptions
-            mode_info = {
-                "auto": "🔄 **Auto (Recommended)**: Tries fast HTTP fetch first. If content is short or missing, automatically uses browser rendering.",
-                "requests": "⚡ **HTTP Requests**: Fast but may fail on JavaScript-heavy sites (LinkedIn, Workday, etc.).",
-                "playwright": "🌐 **Playwright Browser**: Slower but handles all sites including JavaScript-rendered pages."
-            }
-            st.info(mode_info[fetch_mode])
+            st.info(_MODE_INFO[fetch_mode])
             
             if jd_url:
+                # Start fetching while the user reviews the page. Browser-only
+                # fetches are slow and costly, so clicking through the mode
+                # options never starts one; they run when the user analyzes
+                if fetch_mode != "playwright":
+                    from utils.jd_fetcher import prefetch_job_description
+                    prefetch_job_description(jd_url, fetch_mode)
                 st.success("✅ URL entered. Click 'Analyze Job Description' to fetch and analyze.")
         else:
             jd_text = st.text_area(
@@ -314,15 +428,14 @@ if st.session_state.step == 4:
             # Show which mode is being used
             if st.session_state.jd_url:
                 mode = st.session_state.jd_fetch_mode
-                mode_labels = {"auto": "Auto (HTTP + Playwright fallback)", "requests": "HTTP Requests", "playwright": "Playwright Browser"}
-                st.info(f"🔍 Fetching URL using: **{mode_labels.get(mode, mode)}**")
+                st.info(f"🔍 Fetching URL using: **{_MODE_LABELS.get(mode, mode)}**")
             
             with st.spinner("Fetching and analyzing the job description..."):
                 try:
-                    jd_analysis = extract_and_analyze_jd(
-                        job_url=st.session_state.jd_url,
-                        raw_text=st.session_state.jd_text,
-                        fetch_mode=st.session_state.jd_fetch_mode
+                    jd_analysis = cached_extract_and_analyze_jd(
+                        st.session_state.jd_url,
+                        st.session_state.jd_text,
+                        st.session_state.jd_fetch_mode
                     )
                     st.session_state.jd_analysis = jd_analysis
                     st.rerun()
@@ -353,10 +466,10 @@ if st.session_state.step == 4:
             
             # Check if we got actual results
             total_items = (
-                len(jd_analysis.get('required_skills', [])) +
-                len(jd_analysis.get('tools_technologies', [])) +
-                len(jd_analysis.get('ats_keywords', [])) +
-                len(jd_analysis.get('responsibilities', []))
+                len(jd_analysis.get('required_skills', _EMPTY)) +
+                len(jd_analysis.get('tools_technologies', _EMPTY)) +
+                len(jd_analysis.get('ats_keywords', _EMPTY)) +
+                len(jd_analysis.get('responsibilities', _EMPTY))
             )
             
             if total_items > 0:
@@ -368,11 +481,11 @@ if st.session_state.step == 4:
             col1, col2 = st.columns(2)
             with col1:
                 st.write(f"**Seniority Level:** {jd_analysis.get('seniority_level', 'N/A') or 'Not detected'}")
-                st.write(f"**Required Skills:** {len(jd_analysis.get('required_skills', []))} found")
-                st.write(f"**Tools/Technologies:** {len(jd_analysis.get('tools_technologies', []))} found")
+                st.write(f"**Required Skills:** {len(jd_analysis.get('required_skills', _EMPTY))} found")
+                st.write(f"**Tools/Technologies:** {len(jd_analysis.get('tools_technologies', _EMPTY))} found")
             with col2:
-                st.write(f"**ATS Keywords:** {len(jd_analysis.get('ats_keywords', []))} found")
-                st.write(f"**Responsibilities:** {len(jd_analysis.get('responsibilities', []))} found")
+                st.write(f"**ATS Keywords:** {len(jd_analysis.get('ats_keywords', _EMPTY))} found")
+                st.write(f"**Responsibilities:** {len(jd_analysis.get('responsibilities', _EMPTY))} found")
             
             # Show debug information if available
             if '_debug' in jd_analysis or '_raw_content_preview' in jd_analysis:
@@ -432,23 +545,22 @@ if st.session_state.step == 5:
         with col1:
             st.subheader("📊 Job Requirements")
             st.write("**Required Skills:**")
-            st.write(", ".join(jd_analysis.get('required_skills', [])) or "None found")
+            st.write(", ".join(jd_analysis.get('required_skills', _EMPTY)) or "None found")
             
             st.write("**Tools & Technologies:**")
-            st.write(", ".join(jd_analysis.get('tools_technologies', [])) or "None found")
+            st.write(", ".join(jd_analysis.get('tools_technologies', _EMPTY)) or "None found")
             
             st.write("**Seniority Level:**")
             st.write(jd_analysis.get('seniority_level', 'N/A') or "Not detected")
         
         with col2:
             st.subheader("🔑 ATS Keywords")
-            st.write(", ".join(jd_analysis.get('ats_keywords', [])) or "None found")
+            st.write(", ".join(jd_analysis.get('ats_keywords', _EMPTY)) or "None found")
             
             st.subheader("📝 Key Responsibilities")
-            responsibilities = jd_analysis.get('responsibilities', [])[:5]
+            responsibilities = jd_analysis.get('responsibilities', _EMPTY)[:5]
             if responsibilities:
-                for resp in responsibilities:
-                    st.write(f"- {resp}")
+                st.markdown("\n".join(f"- {resp}" for resp in responsibilities))
             else:
                 st.write("None found")
         
@@ -459,6 +571,8 @@ if st.session_state.step == 5:
 
 # Step 6: Show Bullet Suggestions (Editable)
 if st.session_state.step == 6:
+    from utils.llm_resume import rewrite_bullets_batched
+    
     render_navigation(6)
     st.header("Step 6: Review & Edit Bullet Suggestions")
     st.markdown("Review GPT's suggestions and edit them as needed. Your edits will be saved.")
@@ -471,26 +585,33 @@ if st.session_state.step == 6:
             with st.spinner("GPT is rewriting bullets for ATS optimization. This may take a moment..."):
                 try:
                     # Get all bullets from all experiences
+                    experiences = {
+                        exp_key: exp_data
+                        for exp_key, exp_data in st.session_state.extracted_data['experiences'].items()
+                        if exp_data.get('bullets', _EMPTY)
+                    }
+
+                    # Rewrite all bullets from all experiences in a single GPT call
+                    all_bullets = [
+                        (exp_key, idx, bullet)
+                        for exp_key, exp_data in experiences.items()
+                        for idx, bullet in enumerate(exp_data['bullets'])
+                    ]
+                    try:
+                        batched = rewrite_bullets_batched(all_bullets, st.session_state.jd_analysis)
+                    except Exception as e:
+                        st.error(f"Error rewriting bullets: {str(e)}")
+                        batched = {}
+
                     all_bullet_suggestions = {}
-                    for exp_key, exp_data in st.session_state.extracted_data['experiences'].items():
-                        bullets = exp_data.get('bullets', [])
-                        if bullets:
-                            try:
-                                suggestions = rewrite_bullets(bullets, st.session_state.jd_analysis)
-                                all_bullet_suggestions[exp_key] = {
-                                    'role': exp_data['role'],
-                                    'company': exp_data['company'],
-                                    'suggestions': suggestions
-                                }
-                            except Exception as e:
-                                st.error(f"Error processing {exp_data['role']}: {str(e)}")
-                                # Use original bullets as fallback
-                                all_bullet_suggestions[exp_key] = {
-                                    'role': exp_data['role'],
-                                    'company': exp_data['company'],
-                                    'suggestions': [{'original': b, 'suggested': b} for b in bullets]
-                                }
-                    
+                    for exp_key, exp_data in experiences.items():
+                        all_bullet_suggestions[exp_key] = {
+                            'role': exp_data['role'],
+                            'company': exp_data['company'],
+                            # Use original bullets as fallback
+                            'suggestions': batched.get(exp_key) or [{'original': b, 'suggested': b} for b in exp_data['bullets']]
+                        }
+
                     if all_bullet_suggestions:
                         st.session_state.bullet_suggestions = all_bullet_suggestions
                         st.rerun()
@@ -500,48 +621,52 @@ if st.session_state.step == 6:
                     st.error(f"❌ Error generating suggestions: {str(e)}")
                     st.info("💡 Tip: Make sure your resume has experience sections with bullets.")
         else:
-            # Display editable bullet suggestions
-            if not st.session_state.bullet_suggestions:
-                st.warning("No bullet suggestions available.")
-            else:
-                for exp_key, exp_data in st.session_state.bullet_suggestions.items():
-                    with st.expander(f"📋 {exp_data['role']} at {exp_data['company']}", expanded=True):
-                        for idx, suggestion in enumerate(exp_data['suggestions']):
-                            col1, col2 = st.columns([1, 3])
-                            with col1:
-                                st.write("**Original:**")
-                                st.text_area(
-                                    f"Original {idx+1}",
-                                    value=suggestion['original'],
-                                    height=100,
-                                    key=f"orig_{exp_key}_{idx}",
-                                    disabled=True,
-                                    label_visibility="collapsed"
-                                )
-                            with col2:
-                                st.write("**Suggested (Editable):**")
-                                # Get current value from session state or use suggested
-                                current_value = suggestion.get('suggested', suggestion.get('original', ''))
-                                edited = st.text_area(
-                                    f"Edit bullet {idx+1}",
-                                    value=current_value,
-                                    height=100,
-                                    key=f"sugg_{exp_key}_{idx}",
-                                    label_visibility="collapsed",
-                                    help="Edit this bullet point as needed"
-                                )
-                                # Update suggestion in session state
-                                if exp_key in st.session_state.bullet_suggestions:
-                                    if idx < len(st.session_state.bullet_suggestions[exp_key]['suggestions']):
-                                        st.session_state.bullet_suggestions[exp_key]['suggestions'][idx]['suggested'] = edited
-            
-            st.markdown("---")
-            if st.button("Next: Review Skills →", type="primary", use_container_width=True):
-                st.session_state.step = 7
-                st.rerun()
+            # Display editable bullet suggestions in a form so edits are
+            # submitted together instead of rerunning the page per text area
+            with st.form("bullets_form", border=False):
+                if not st.session_state.bullet_suggestions:
+                    st.warning("No bullet suggestions available.")
+                else:
+                    for exp_key, exp_data in st.session_state.bullet_suggestions.items():
+                        with st.expander(f"📋 {exp_data['role']} at {exp_data['company']}", expanded=True):
+                            for idx, suggestion in enumerate(exp_data['suggestions']):
+                                col1, col2 = st.columns([1, 3])
+                                with col1:
+                                    st.write("**Original:**")
+                                    st.text_area(
+                                        f"Original {idx+1}",
+                                        value=suggestion['original'],
+                                        height=100,
+                                        key=f"orig_{exp_key}_{idx}",
+                                        disabled=True,
+                                        label_visibility="collapsed"
+                                    )
+                                with col2:
+                                    st.write("**Suggested (Editable):**")
+                                    # Get current value from session state or use suggested
+                                    current_value = suggestion.get('suggested', suggestion.get('original', ''))
+                                    edited = st.text_area(
+                                        f"Edit bullet {idx+1}",
+                                        value=current_value,
+                                        height=100,
+                                        key=f"sugg_{exp_key}_{idx}",
+                                        label_visibility="collapsed",
+                                        help="Edit this bullet point as needed"
+                                    )
+                                    # Update suggestion in session state
+                                    if exp_key in st.session_state.bullet_suggestions:
+                                        if idx < len(st.session_state.bullet_suggestions[exp_key]['suggestions']):
+                                            st.session_state.bullet_suggestions[exp_key]['suggestions'][idx]['suggested'] = edited
+                
+                st.markdown("---")
+                if st.form_submit_button("Save & Next: Review Skills →", type="primary", use_container_width=True):
+                    st.session_state.step = 7
+                    st.rerun()
 
 # Step 7: Show Skill Suggestions (Editable)
 if st.session_state.step == 7:
+    from utils.llm_resume import suggest_skills
+    
     render_navigation(7)
     st.header("Step 7: Review & Edit Skill Suggestions")
     st.markdown("Review and edit which skills to add, keep, or mark as optional.")
@@ -550,98 +675,85 @@ if st.session_state.step == 7:
         st.warning("⚠️ Please complete previous steps first.")
     else:
         if not st.session_state.skill_suggestions:
-            st.info("🔄 Generating skill suggestions...")
-            with st.spinner("GPT is analyzing skill matches. This may take a moment..."):
-                try:
-                    existing_skills = st.session_state.extracted_data.get('skills', [])
-                    jd_skills = st.session_state.jd_analysis.get('required_skills', []) + \
-                               st.session_state.jd_analysis.get('tools_technologies', [])
-                    if not existing_skills:
-                        st.warning("⚠️ No skills found in your resume.")
-                    if not jd_skills:
-                        st.warning("⚠️ No skills found in job description.")
-                    
-                    suggestions = suggest_skills(existing_skills, jd_skills)
-                    st.session_state.skill_suggestions = suggestions
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Error generating suggestions: {str(e)}")
-                    st.info("💡 Tip: Make sure your resume and job description have skills listed.")
+            # Skills are matched locally, so this is instant and needs no GPT call
+            try:
+                existing_skills, jd_skills = get_skill_inputs()
+                if not existing_skills:
+                    st.warning("⚠️ No skills found in your resume.")
+                if not jd_skills:
+                    st.warning("⚠️ No skills found in job description.")
+                
+                st.session_state.skill_suggestions = suggest_skills(existing_skills, jd_skills)
+                st.rerun()
+            except Exception as e:
+                st.error(f"❌ Error generating suggestions: {str(e)}")
+                st.info("💡 Tip: Make sure your resume and job description have skills listed.")
         else:
             suggestions = st.session_state.skill_suggestions
             
-            # Helper function to parse skills
-            def parse_skills(text):
-                skills = []
-                for line in text.split('\n'):
-                    line = line.strip()
-                    if ',' in line:
-                        skills.extend([s.strip() for s in line.split(',') if s.strip()])
-                    elif line:
-                        skills.append(line)
-                return [s for s in skills if s]
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.subheader("➕ Add These Skills")
-                st.caption("Skills from JD that are missing from your resume")
-                add_skills_text = "\n".join(suggestions.get('add', []))
-                add_skills = st.text_area(
-                    "Skills to add",
-                    value=add_skills_text,
-                    height=200,
-                    key="add_skills",
-                    help="One skill per line or comma-separated",
-                    label_visibility="collapsed"
-                )
-            
-            with col2:
-                st.subheader("✅ Keep These Skills")
-                st.caption("Skills you have that match the JD")
-                keep_skills_text = "\n".join(suggestions.get('keep', []))
-                keep_skills = st.text_area(
-                    "Skills to keep",
-                    value=keep_skills_text,
-                    height=200,
-                    key="keep_skills",
-                    help="One skill per line or comma-separated",
-                    label_visibility="collapsed"
-                )
-            
-            with col3:
-                st.subheader("⚪ Optional Skills")
-                st.caption("Skills in your resume but not in JD")
-                optional_skills_text = "\n".join(suggestions.get('optional', []))
-                optional_skills = st.text_area(
-                    "Optional skills",
-                    value=optional_skills_text,
-                    height=200,
-                    key="optional_skills",
-                    help="One skill per line or comma-separated",
-                    label_visibility="collapsed"
-                )
-            
-            # Update session state with parsed skills
-            st.session_state.skill_suggestions = {
-                'add': parse_skills(add_skills),
-                'keep': parse_skills(keep_skills),
-                'optional': parse_skills(optional_skills)
-            }
+            # Seed the text areas once; after that the widgets own their text
+            for field in ('add', 'keep', 'optional'):
+                if f"{field}_skills" not in st.session_state:
+                    st.session_state[f"{field}_skills"] = "\n".join(suggestions.get(field, _EMPTY))
             
-            # Show summary
-            st.info(f"📊 Summary: {len(st.session_state.skill_suggestions['add'])} to add, "
-                   f"{len(st.session_state.skill_suggestions['keep'])} to keep, "
-                   f"{len(st.session_state.skill_suggestions['optional'])} optional")
-            
-            st.markdown("---")
-            if st.button("Next: Generate LaTeX →", type="primary", use_container_width=True):
-                st.session_state.step = 8
-                st.rerun()
+            # Edit skills in a form so changes are submitted together
+            with st.form("skills_form", border=False):
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.subheader("➕ Add These Skills")
+                    st.caption("Skills from JD that are missing from your resume")
+                    add_skills = st.text_area(
+                        "Skills to add",
+                        height=200,
+                        key="add_skills",
+                        help="One skill per line or comma-separated",
+                        label_visibility="collapsed"
+                    )
+                
+                with col2:
+                    st.subheader("✅ Keep These Skills")
+                    st.caption("Skills you have that match the JD")
+                    keep_skills = st.text_area(
+                        "Skills to keep",
+                        height=200,
+                        key="keep_skills",
+                        help="One skill per line or comma-separated",
+                        label_visibility="collapsed"
+                    )
+                
+                with col3:
+                    st.subheader("⚪ Optional Skills")
+                    st.caption("Skills in your resume but not in JD")
+                    optional_skills = st.text_area(
+                        "Optional skills",
+                        height=200,
+                        key="optional_skills",
+                        help="One skill per line or comma-separated",
+                        label_visibility="collapsed"
+                    )
+                
+                # Update session state with parsed skills
+                st.session_state.skill_suggestions = {
+                    'add': parse_skills(add_skills),
+                    'keep': parse_skills(keep_skills),
+                    'optional': parse_skills(optional_skills)
+                }
+                
+                # Show summary
+                st.info(f"📊 Summary: {len(st.session_state.skill_suggestions['add'])} to add, "
+                       f"{len(st.session_state.skill_suggestions['keep'])} to keep, "
+                       f"{len(st.session_state.skill_suggestions['optional'])} optional")
+                
+                st.markdown("---")
+                if st.form_submit_button("Save & Next: Generate LaTeX →", type="primary", use_container_width=True):
+                    st.session_state.step = 8
+                    st.rerun()
 
 # Step 8: Generate Updated LaTeX
-if st.session_state.step == 8:
-    render_navigation(8)
+@st.fragment
+def render_generate_step():
+    """Render Step 8 as a fragment so its interactions rerun only this block."""
     st.header("Step 8: Generate Updated LaTeX")
     st.markdown("Generate the final LaTeX resume with your approved edits.")
     
@@ -650,85 +762,128 @@ if st.session_state.step == 8:
         not st.session_state.skill_suggestions):
         st.warning("⚠️ Please complete previous steps first.")
     else:
-        if st.session_state.updated_latex is None:
+        # "Go Back" is only drawn after a failed generation, so its click is
+        # handled here, on the rerun where that branch no longer runs
+        if st.session_state.get('generate_go_back'):
+            go_to_step(7)
+        
+        # Fingerprint the approved edits so unchanged inputs skip regeneration
+        # and edits made after going back are picked up
+        generation_fp = hashlib.blake2b(json.dumps({
+            'latex': st.session_state.get('_latex_hash'),
+            'bullets': st.session_state.bullet_suggestions,
+            'skills': st.session_state.skill_suggestions,
+        }, sort_keys=True).encode('utf-8'), digest_size=16).digest()
+        
+        is_current = (
+            st.session_state.updated_latex is not None and
+            st.session_state.get('updated_latex_fp') == generation_fp
+        )
+        
+        # Generate only when asked; a failure clears the request so the user
+        # can retry deliberately
+        if not is_current and not st.session_state.get('request_generate'):
+            if st.session_state.updated_latex is not None:
+                st.info("Your edits changed since the last generation.")
+            if st.button("⚙️ Generate Updated LaTeX", type="primary", use_container_width=True):
+                st.session_state.request_generate = True
+        
+        if not is_current and st.session_state.get('request_generate'):
             with st.spinner("🔄 Generating updated LaTeX resume..."):
                 try:
-                    # Prepare updated experiences
-                    updated_experiences = {}
-                    for exp_key, exp_data in st.session_state.bullet_suggestions.items():
-                        # Get edited bullets from suggestions
-                        edited_bullets = []
-                        for suggestion in exp_data.get('suggestions', []):
-                            edited_bullets.append(suggestion.get('suggested', suggestion.get('original', '')))
-                        
-                        updated_experiences[exp_key] = {
+                    # Read session state once rather than per experience
+                    bullet_suggestions = st.session_state.bullet_suggestions
+                    skill_suggestions = st.session_state.skill_suggestions
+                    
+                    # Prepare updated experiences from the edited bullets
+                    updated_experiences = {
+                        exp_key: {
                             'role': exp_data['role'],
                             'company': exp_data['company'],
-                            'bullets': edited_bullets
+                            'bullets': [
+                                suggestion['suggested'] if 'suggested' in suggestion else suggestion.get('original', '')
+                                for suggestion in exp_data.get('suggestions', _EMPTY)
+                            ]
                         }
+                        for exp_key, exp_data in bullet_suggestions.items()
+                    }
                     
                     # Prepare updated skills (combine keep + add, exclude optional unless user wants them)
-                    updated_skills = (
-                        st.session_state.skill_suggestions.get('keep', []) +
-                        st.session_state.skill_suggestions.get('add', [])
-                    )
+                    # dict.fromkeys drops skills listed in both while keeping their order
+                    updated_skills = list(dict.fromkeys(chain(
+                        skill_suggestions.get('keep', _EMPTY),
+                        skill_suggestions.get('add', _EMPTY)
+                    )))
                     
                     if not updated_skills:
                         st.warning("⚠️ No skills selected. Using original skills.")
                         updated_skills = st.session_state.extracted_data.get('skills', [])
                     
                     # Generate updated LaTeX
-                    updated_latex = update_latex_resume(
+                    updated_latex = cached_update_latex_resume(
                         st.session_state.latex_content,
                         updated_experiences,
                         updated_skills
                     )
                     
                     st.session_state.updated_latex = updated_latex
-                    st.rerun()
+                    st.session_state.updated_latex_preview = build_latex_preview(updated_latex)
+                    st.session_state.updated_latex_fp = generation_fp
+                    st.session_state.request_generate = False
+                    is_current = True
+                    
+                    # Store summary counts so reruns don't recompute them
+                    st.session_state.summary_total_bullets = sum(
+                        len(exp['bullets']) for exp in updated_experiences.values()
+                    )
+                    st.session_state.updated_skills = updated_skills
                     
                 except KeyError as e:
+                    st.session_state.request_generate = False
                     st.error(f"❌ Error: Missing required data - {str(e)}")
                     st.info("💡 Tip: Make sure you've completed all previous steps and edited your bullets/skills.")
-                    if st.button("Go Back"):
-                        st.session_state.step = 7
-                        st.rerun()
+                    st.button("Go Back", key="generate_go_back")
                 except Exception as e:
+                    st.session_state.request_generate = False
                     error_msg = str(e)
-                    if "section" in error_msg.lower() or "not found" in error_msg.lower():
+                    lowered = error_msg.lower()
+                    if "section" in lowered or "not found" in lowered:
                         st.error("❌ Could not find Experience or Skills sections in your LaTeX file.")
                         st.info("💡 Tip: Make sure your LaTeX file contains the expected section structure.")
                     else:
                         st.error(f"❌ Error generating LaTeX: {error_msg}")
-        else:
+        
+        # Render the result in the same run that generated it
+        if is_current:
             st.success("✅ Updated LaTeX generated successfully!")
             
             # Show summary of changes
             st.subheader("📊 Summary of Changes")
             col1, col2 = st.columns(2)
             with col1:
-                total_bullets = sum(len(exp['suggestions']) for exp in st.session_state.bullet_suggestions.values())
-                st.metric("Bullets Updated", total_bullets)
+                st.metric("Bullets Updated", st.session_state.summary_total_bullets)
             with col2:
-                total_skills = len(st.session_state.skill_suggestions.get('keep', []) + 
-                                 st.session_state.skill_suggestions.get('add', []))
-                st.metric("Skills in Resume", total_skills)
+                st.metric("Skills in Resume", len(st.session_state.updated_skills))
             
             # Show preview
             with st.expander("📄 Preview Updated LaTeX (first 2000 characters)"):
-                preview_text = st.session_state.updated_latex[:2000]
-                if len(st.session_state.updated_latex) > 2000:
-                    preview_text += "\n\n... (truncated, full file available for download)"
-                st.code(preview_text, language='latex')
+                st.code(st.session_state.updated_latex_preview, language='latex')
             
             st.markdown("---")
             if st.button("Next: Download →", type="primary", use_container_width=True):
                 st.session_state.step = 9
                 st.rerun()
 
+
+if st.session_state.step == 8:
+    render_navigation(8)
+    render_generate_step()
+
+
 # Step 9: Download .tex File
-if st.session_state.step == 9:
-    render_navigation(9)
+@st.fragment
+def render_download_step():
+    """Render Step 9 as a fragment so its interactions rerun only this block."""
     st.header("Step 9: Download Updated Resume")
     
     if st.session_state.updated_latex is None:
@@ -741,25 +896,24 @@ if st.session_state.step == 9:
         # Download button
         st.download_button(
             label="📥 Download Updated Resume (.tex)",
-            data=st.session_state.updated_latex,
+            data=encode_latex(st.session_state.updated_latex),
             file_name="resume_optimized.tex",
             mime="text/plain",
             type="primary",
             use_container_width=True
         )
         
-        # Show final preview
-        with st.expander("📄 Final LaTeX Preview"):
+        # Show final preview only on request - the full file can be large
+        if st.toggle("📄 Show final LaTeX preview", value=False, key="show_full_preview"):
             st.code(st.session_state.updated_latex, language='latex')
         
         st.markdown("---")
-        st.markdown("### What's next?")
-        st.markdown("""
-        1. **Compile your LaTeX** - Use a LaTeX editor (Overleaf, TeXstudio, etc.) to generate PDF
-        2. **Review the output** - Check formatting and make any final adjustments
-        3. **Start a new optimization** - Click the button below to start over with a new job description
-        """)
+        st.markdown(_WHATS_NEXT_MD)
         
         if st.button("🔄 Start Over with New Job", use_container_width=True):
             reset_to_home()
 
+
+if st.session_state.step == 9:
+    render_navigation(9)
+    render_download_step()
@@ -0,0 +1,31 @@
+"""Tests for utils.latex_editor bullet replacement."""
+
+from utils.latex_editor import replace_bullets_in_experience_block
+
+
+def _experience_block(*bullets: str) -> str:
+    """Build the content that follows a \\resumeSubheading{role}{company}."""
+    items = "".join(f"  \\resumeItem{{{bullet}}}\n" for bullet in bullets)
+    return "{Jan 2020 -- Present}{Remote}\n\\resumeItemListStart\n" + items + "\\resumeItemListEnd\n"
+
+
+def test_duplicate_bullets_in_experience():
+    # Identical bullets are each replaced at their own position
+    result = replace_bullets_in_experience_block(_experience_block("Same", "Same"), ["X", "Same"])
+    
+    assert result == _experience_block("X", "Same")
+
+
+def test_replacement_text_matching_a_later_bullet():
+    # Inserted text is never searched again, so "B" does not replace the second bullet
+    result = replace_bullets_in_experience_block(_experience_block("A", "B"), ["B", "Z"])
+    
+    assert result == _experience_block("B", "Z")
+
+
+def test_duplicate_item_bullets():
+    block = "\\begin{itemize}\n\\item Same\n\\item Same\n\\end{itemize}"
+    
+    result = replace_bullets_in_experience_block(block, ["X", "Same"])
+    
+    assert result == "\\begin{itemize}\n\\item X\n\\item Same\n\\end{itemize}"
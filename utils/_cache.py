@@ -0,0 +1,59 @@
+"""
+Small thread-safe LRU cache shared by the utils modules.
+
+Values are deep-copied on the way in and out, so callers can mutate what
+they store or get back without poisoning the cache.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Least recently used cache with an optional time-to-live.
+    
+    Args:
+        maxsize: Entries kept before the least recently used one is evicted
+        ttl: Seconds an entry stays fresh, or None to keep it until evicted
+    """
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of a fresh cached value, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+        
+        return copy.deepcopy(value)
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a copy of a value, evicting the least recently used entry."""
+        entry = (time.monotonic(), copy.deepcopy(value))
+        
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def discard(self, key: Hashable) -> None:
+        """Forget a cached value, if there is one."""
+        with self._lock:
+            self._entries.pop(key, None)
@@ -0,0 +1,47 @@
+"""
+Shared OpenAI client for the GPT-backed utils modules.
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+from openai import OpenAI
+
+
+_clients: Dict[Optional[int], OpenAI] = {}
+_clients_api_key: Optional[str] = None
+_clients_lock = threading.Lock()
+
+
+def get_openai_client(max_retries: Optional[int] = None) -> OpenAI:
+    """
+    Return a shared OpenAI client so calls reuse its pooled HTTPS connections.
+    
+    Clients with a different max_retries are derived from the same base
+    client and share its connection pool. All clients are rebuilt if
+    OPENAI_API_KEY changes.
+    
+    Args:
+        max_retries: SDK retry count, or None for the SDK default
+    
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    global _clients_api_key
+    
+    # Get API key from environment
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable is not set")
+    
+    with _clients_lock:
+        if _clients_api_key != api_key:
+            _clients.clear()
+            _clients_api_key = api_key
+        
+        if None not in _clients:
+            _clients[None] = OpenAI(api_key=api_key)
+        if max_retries not in _clients:
+            _clients[max_retries] = _clients[None].with_options(max_retries=max_retries)
+        return _clients[max_retries]
@@ -13,14 +13,66 @@ Usage:
     result = fetch_job_description("https://example.com/job/12345")
 """
 
-from typing import Dict, Optional, Tuple, Any, List, Literal
+from typing import Dict, Optional, Tuple, Any, List, Literal, NamedTuple
 from urllib.parse import urlparse, parse_qs
-from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate, count
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, Future
+import os
+import threading
 import time
+import copy
+import codecs
 import re
 import json
 import requests
-from bs4 import BeautifulSoup, Comment
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, Comment, SoupStrainer, Tag
+
+# Prefer the C-based lxml parser; fall back to the stdlib parser if missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Optional: selectolax's Lexbor parser for a much faster cleaning pass
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional: orjson for faster JSON-LD decoding (raises a json.JSONDecodeError subclass)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional: RE2's linear-time matcher for URL detection and boilerplate/legal patterns
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional: Playwright for JavaScript-rendered pages
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+except ImportError:
+    sync_playwright = None
+    PlaywrightTimeout = None
+
+# Optional: trafilatura for the readability-style fallback
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+# Shared LRU cache helper
+from utils._cache import LRUCache
 
 
 # =============================================================================
@@ -33,6 +85,37 @@ MIN_CONTENT_LENGTH = 1000
 # Request timeout in seconds
 REQUEST_TIMEOUT = 30
 
+# Bytes read per chunk when streaming HTML responses
+STREAM_CHUNK_SIZE = 16384
+
+# Stop reading pathologically large pages after this many bytes
+MAX_HTML_BYTES = 5 * 1024 * 1024
+
+# Leading bytes searched for a BOM or <meta charset> before falling back to chardet
+CHARSET_SNIFF_BYTES = 1024
+
+# Retries for transient HTTP failures (connection errors, 429, 5xx)
+REQUEST_RETRIES = 2
+
+# Memoized detect_source/resolve_url results (pure functions of the URL)
+URL_CACHE_SIZE = 1024
+
+# Successful fetches are reused for repeat URLs within this window
+FETCH_CACHE_SIZE = 128
+FETCH_CACHE_TTL_SECONDS = 3600
+
+# Maximum number of URLs fetched concurrently by fetch_job_descriptions()
+MAX_CONCURRENT_FETCHES = 8
+
+# Container selectors remembered per (hostname, source) for Playwright fetches
+SELECTOR_CACHE_SIZE = 256
+
+# Warm headless browsers kept for Playwright fetches (one per worker thread)
+PLAYWRIGHT_POOL_SIZE = int(os.getenv('PLAYWRIGHT_POOL_SIZE', '2'))
+
+# Maximum number of background prefetches kept in memory
+MAX_PREFETCH_ENTRIES = 8
+
 # Job source type
 JobSource = Literal["greenhouse", "lever", "workday", "icims", "taleo", "smartrecruiters", "generic"]
 
@@ -54,12 +137,16 @@ JD_INDICATORS = [
     "position",
 ]
 
+# Single case-insensitive pass over the text for any indicator
+JD_INDICATOR_REGEX = re.compile('|'.join(re.escape(indicator) for indicator in JD_INDICATORS), re.IGNORECASE)
+
 # Browser-like headers to avoid bot detection
 DEFAULT_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.9',
-    'Accept-Encoding': 'gzip, deflate, br',
+    # Only codings urllib3 can decode here (adds br/zstd when brotli/zstandard are installed)
+    'Accept-Encoding': ACCEPT_ENCODING,
     'DNT': '1',
     'Connection': 'keep-alive',
     'Upgrade-Insecure-Requests': '1',
@@ -122,9 +209,112 @@ ATS_SELECTORS = {
     },
 }
 
+# Platform patterns compiled once at import
+GREENHOUSE_REGEX = re.compile('|'.join(GREENHOUSE_PATTERNS))
+LEVER_REGEX = re.compile('|'.join(LEVER_PATTERNS))
+WORKDAY_REGEX = re.compile('|'.join(WORKDAY_PATTERNS))
+
+# Substring patterns for the remaining ATS platforms, in priority order
+OTHER_ATS_REGEXES = [
+    (ats_type, re.compile('|'.join(re.escape(pattern) for pattern in config["patterns"])))
+    for ats_type, config in ATS_SELECTORS.items()
+    if ats_type not in ("greenhouse", "lever", "workday")
+]
+
+# Platforms whose postings are rendered client-side; auto mode starts the
+# Playwright fetch alongside the HTTP attempt for these
+JS_HEAVY_SOURCES = {"workday", "smartrecruiters"}
+
+# Playwright resource types that never contribute to JD text
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "other"}
+
+# Analytics/ad hosts blocked during Playwright fetches
+BLOCKED_RESOURCE_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "newrelic.com",
+    "nr-data.net",
+    "optimizely.com",
+)
+
+# Chromium features a text-only scraper never needs; images are also switched
+# off in the renderer, on top of the request blocking above
+CHROMIUM_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,BackForwardCache",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Frames never worth reading text from: blocked hosts plus captcha widgets
+SKIPPED_FRAME_DOMAINS = BLOCKED_RESOURCE_DOMAINS + ("recaptcha", "hcaptcha.com")
+
+
+def _build_source_url_set():
+    """
+    Compile every platform URL pattern into one RE2 Set, in priority order.
+    
+    Returns:
+        (set, sources) where sources[i] is the platform of pattern i, or
+        (None, []) when RE2 is unavailable
+    """
+    if re2 is None:
+        return None, []
+    
+    platform_patterns = [
+        ("greenhouse", GREENHOUSE_PATTERNS),
+        ("lever", LEVER_PATTERNS),
+        ("workday", WORKDAY_PATTERNS),
+    ] + [
+        (ats_type, [re.escape(pattern) for pattern in config["patterns"]])
+        for ats_type, config in ATS_SELECTORS.items()
+        if ats_type not in ("greenhouse", "lever", "workday")
+    ]
+    
+    try:
+        url_set = re2.Set.SearchSet(re2.Options())
+        sources = []
+        for ats_type, patterns in platform_patterns:
+            for pattern in patterns:
+                url_set.Add(pattern)
+                sources.append(ats_type)
+        url_set.Compile()
+        return url_set, sources
+    except Exception:
+        return None, []
+
+
+# Lowest matching pattern index wins, which preserves platform priority
+SOURCE_URL_SET, SOURCE_URL_SET_SOURCES = _build_source_url_set()
+
 # Semantic containers for content-aware waiting
 SEMANTIC_CONTAINERS = ["main", "article", "body"]
 
+# Any semantic container other than body, waited for with a single selector
+SEMANTIC_CONTAINER_SELECTOR = ", ".join(c for c in SEMANTIC_CONTAINERS if c != "body")
+
+# Returns the text of the first selector that reaches the threshold, else the
+# longest one, so only the winning text crosses the CDP boundary
+BEST_CONTAINER_TEXT_JS = """([selectors, threshold]) => {
+    let best = {selector: null, text: ''};
+    for (const selector of selectors) {
+        const text = document.querySelector(selector)?.innerText || '';
+        if (text.trim().length > best.text.trim().length) {
+            best = {selector, text};
+            if (text.trim().length >= threshold) break;
+        }
+    }
+    return best;
+}"""
+
 
 # =============================================================================
 # BOILERPLATE REMOVAL PATTERNS
@@ -138,6 +328,12 @@ REMOVE_TAGS = {
     'advertisement', 'ads', 'ad'
 }
 
+# All REMOVE_TAGS as one CSS selector list (selectolax path)
+REMOVE_TAGS_SELECTOR = ', '.join(sorted(REMOVE_TAGS))
+
+# Parse only the document body; <head> never contributes JD text
+BODY_STRAINER = SoupStrainer('body')
+
 # Classes/IDs indicating boilerplate content
 BOILERPLATE_PATTERNS = [
     r'nav(igation)?[-_]?',
@@ -173,8 +369,24 @@ BOILERPLATE_PATTERNS = [
     r'search[-_]?(box|form|bar)?',
 ]
 
+
+def _compile_alternation(patterns: List[str]):
+    """Compile a case-insensitive alternation, using RE2 when it is installed."""
+    pattern = '|'.join(patterns)
+    
+    if re2 is not None:
+        try:
+            options = re2.Options()
+            options.case_sensitive = False
+            return re2.compile(pattern, options)
+        except Exception:
+            pass
+    
+    return re.compile(pattern, re.IGNORECASE)
+
+
 # Compile patterns for efficiency
-BOILERPLATE_REGEX = re.compile('|'.join(BOILERPLATE_PATTERNS), re.IGNORECASE)
+BOILERPLATE_REGEX = _compile_alternation(BOILERPLATE_PATTERNS)
 
 # Legal/boilerplate text patterns to remove
 LEGAL_TEXT_PATTERNS = [
@@ -189,27 +401,57 @@ LEGAL_TEXT_PATTERNS = [
     r'this\s+site\s+uses\s+cookies',
 ]
 
-LEGAL_REGEX = re.compile('|'.join(LEGAL_TEXT_PATTERNS), re.IGNORECASE)
+LEGAL_REGEX = _compile_alternation(LEGAL_TEXT_PATTERNS)
+
+# <script type="application/ld+json"> blocks, matched directly in raw HTML
+JSON_LD_SCRIPT_REGEX = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Class names that usually mark the main job content container
+CONTENT_CLASS_REGEX = re.compile(r'job|content|description', re.I)
+
+# CSS equivalent of CONTENT_CLASS_REGEX for the selectolax path
+CONTENT_CLASS_SELECTOR = '[class*="job" i], [class*="content" i], [class*="description" i]'
+
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_REGEX = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([a-z0-9_.:-]+)', re.IGNORECASE)
+
+# Byte order marks, checked before any declared charset
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Whitespace/symbol cleanup patterns used by _final_cleanup
+SYMBOL_LINE_REGEX = re.compile(r'^[\s\-\u2022\u00b7*|/\\]+$')
+
+# Only spans that actually change: newline + indentation, runs of 2+, tabs
+WHITESPACE_CLEANUP_REGEX = re.compile(r'\n[ \t]+|[ \t]{2,}|\t')
 
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
-class FetchResult:
-    """Result of a URL fetch operation."""
+class FetchResult(NamedTuple):
+    """Result of a URL fetch operation (immutable, no per-instance __dict__)."""
     success: bool
     html: Optional[str]
     status_code: Optional[int]
     error_message: Optional[str]
     final_url: str
+    # JobPosting found while streaming the body, if any
+    schema_data: Optional[Dict[str, Any]] = None
 
 
 # =============================================================================
 # SOURCE DETECTION
 # =============================================================================
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def detect_source(url: str) -> JobSource:
     """
     Detect the job posting platform from URL using regex patterns.
@@ -227,84 +469,86 @@ def detect_source(url: str) -> JobSource:
     """
     url_lower = url.lower()
     
+    if SOURCE_URL_SET is not None:
+        return _detect_source_with_set(url, url_lower)
+    
     # Check Greenhouse patterns (including gh_jid param)
-    if _detect_greenhouse(url):
+    if _detect_greenhouse(url, url_lower):
         return "greenhouse"
     
     # Check Lever patterns
-    if _detect_lever(url):
+    if _detect_lever(url_lower):
         return "lever"
     
     # Check Workday patterns
-    if _detect_workday(url):
+    if _detect_workday(url, url_lower):
         return "workday"
     
     # Check other ATS platforms by URL pattern
-    for ats_type, config in ATS_SELECTORS.items():
-        if ats_type in ["greenhouse", "lever", "workday"]:
-            continue
-        for pattern in config["patterns"]:
-            if pattern in url_lower:
-                return ats_type
+    for ats_type, regex in OTHER_ATS_REGEXES:
+        if regex.search(url_lower):
+            return ats_type
     
     return "generic"
 
 
-def _detect_greenhouse(url: str) -> bool:
-    """Detect if URL is a Greenhouse job posting."""
-    url_lower = url.lower()
-    
-    for pattern in GREENHOUSE_PATTERNS:
-        if re.search(pattern, url_lower):
-            return True
+def _detect_source_with_set(url: str, url_lower: str) -> JobSource:
+    """Same priority as detect_source, with every URL pattern matched in one RE2 Set scan."""
+    matches = SOURCE_URL_SET.Match(url_lower)
+    best = SOURCE_URL_SET_SOURCES[min(matches)] if matches else None
     
-    # Check for gh_jid in query params
-    try:
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
-        if 'gh_jid' in query_params:
-            return True
-    except Exception:
-        pass
+    if best == "greenhouse" or _has_gh_jid_param(url):
+        return "greenhouse"
+    if best == "lever":
+        return "lever"
+    if best == "workday" or _has_workday_hostname(url, url_lower):
+        return "workday"
     
-    return False
+    return best or "generic"
+
 
+def _detect_greenhouse(url: str, url_lower: str) -> bool:
+    """Detect if URL is a Greenhouse job posting."""
+    return GREENHOUSE_REGEX.search(url_lower) is not None or _has_gh_jid_param(url)
 
-def _detect_lever(url: str) -> bool:
+
+def _detect_lever(url_lower: str) -> bool:
     """Detect if URL is a Lever job posting."""
-    url_lower = url.lower()
-    
-    for pattern in LEVER_PATTERNS:
-        if re.search(pattern, url_lower):
-            return True
-    
-    return False
+    return LEVER_REGEX.search(url_lower) is not None
 
 
-def _detect_workday(url: str) -> bool:
+def _detect_workday(url: str, url_lower: str) -> bool:
     """Detect if URL is a Workday job posting."""
-    url_lower = url.lower()
-    
-    for pattern in WORKDAY_PATTERNS:
-        if re.search(pattern, url_lower):
-            return True
+    return WORKDAY_REGEX.search(url_lower) is not None or _has_workday_hostname(url, url_lower)
+
+
+def _has_gh_jid_param(url: str) -> bool:
+    """Check for gh_jid in query params (only parses when it can be present)."""
+    if 'gh_jid' not in url:
+        return False
     
-    # Check hostname for workday
     try:
-        parsed = urlparse(url)
-        hostname = parsed.hostname or ""
-        if "workday" in hostname.lower():
-            return True
+        return 'gh_jid' in parse_qs(urlparse(url).query)
     except Exception:
-        pass
+        return False
+
+
+def _has_workday_hostname(url: str, url_lower: str) -> bool:
+    """Check hostname for workday (only parses when it can be present)."""
+    if 'workday' not in url_lower:
+        return False
     
-    return False
+    try:
+        return "workday" in (urlparse(url).hostname or "")
+    except Exception:
+        return False
 
 
 # =============================================================================
 # URL RESOLUTION
 # =============================================================================
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def resolve_url(url: str, source: JobSource) -> Tuple[str, bool]:
     """
     Resolve URL to canonical form based on detected source.
@@ -320,11 +564,15 @@ def resolve_url(url: str, source: JobSource) -> Tuple[str, bool]:
         Tuple of (resolved_url, was_resolved)
     """
     if source == "greenhouse":
-        return _resolve_greenhouse_url(url)
+        resolved_url, was_resolved = _resolve_greenhouse_url(url)
     elif source == "lever":
-        return _resolve_lever_url(url)
+        resolved_url, was_resolved = _resolve_lever_url(url)
     else:
         return url, False
+    
+    # A URL that is already canonical was not resolved; this keeps callers
+    # from retrying the very same URL when the first fetch fails
+    return resolved_url, was_resolved and resolved_url != url
 
 
 def _resolve_greenhouse_url(url: str) -> Tuple[str, bool]:
@@ -425,40 +673,45 @@ def extract_schema_job_posting(html: str) -> Optional[Dict[str, Any]]:
     Returns:
         Parsed JobPosting data or None if not found
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    # Scan the raw HTML for JSON-LD blocks instead of building a parse tree
+    for match in JSON_LD_SCRIPT_REGEX.finditer(html):
+        job_posting = _job_posting_from_json_ld(match.group(1))
+        if job_posting is not None:
+            return job_posting
     
-    # Find all script tags with JSON-LD
-    script_tags = soup.find_all('script', type='application/ld+json')
+    return None
+
+
+def _job_posting_from_json_ld(content: str) -> Optional[Dict[str, Any]]:
+    """Return the normalized JobPosting in one JSON-LD block, or None."""
+    # Only decode blocks that can contain a JobPosting at all
+    if 'JobPosting' not in content:
+        return None
     
-    for script in script_tags:
-        try:
-            content = script.string
-            if not content:
-                continue
-            
-            data = json.loads(content)
+    try:
+        data = json_loads(content)
+        
+        # Handle array of schemas
+        if isinstance(data, list):
+            for item in data:
+                if _is_job_posting(item):
+                    return _normalize_job_posting(item)
+        
+        # Handle single schema
+        elif isinstance(data, dict):
+            if _is_job_posting(data):
+                return _normalize_job_posting(data)
             
-            # Handle array of schemas
-            if isinstance(data, list):
-                for item in data:
+            # Check @graph structure
+            if '@graph' in data:
+                for item in data['@graph']:
                     if _is_job_posting(item):
                         return _normalize_job_posting(item)
-            
-            # Handle single schema
-            elif isinstance(data, dict):
-                if _is_job_posting(data):
-                    return _normalize_job_posting(data)
-                
-                # Check @graph structure
-                if '@graph' in data:
-                    for item in data['@graph']:
-                        if _is_job_posting(item):
-                            return _normalize_job_posting(item)
-        
-        except json.JSONDecodeError:
-            continue
-        except Exception:
-            continue
+    
+    except json.JSONDecodeError:
+        pass
+    except Exception:
+        pass
     
     return None
 
@@ -497,19 +750,32 @@ def _normalize_job_posting(data: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in normalized.items() if v}
 
 
+def _schema_text_from_dict(value: Dict) -> Optional[str]:
+    """Text of a structured schema value such as {"@value": ...} or {"name": ...}."""
+    for sub_key in ('@value', 'name', 'value'):
+        if sub_key in value:
+            return str(value[sub_key]).strip()
+    return None
+
+
+# Text extraction per JSON type; decoded JSON only ever holds these exact types
+_SCHEMA_VALUE_HANDLERS = {
+    str: str.strip,
+    dict: _schema_text_from_dict,
+    list: lambda value: ', '.join([str(v) for v in value if v]),
+}
+
+
 def _extract_schema_value(data: Dict, keys: List[str]) -> Optional[str]:
     """Extract first matching value from a list of possible keys."""
     for key in keys:
         value = data.get(key)
         if value:
-            if isinstance(value, str):
-                return value.strip()
-            elif isinstance(value, dict):
-                for sub_key in ['@value', 'name', 'value']:
-                    if sub_key in value:
-                        return str(value[sub_key]).strip()
-            elif isinstance(value, list):
-                return ', '.join(str(v) for v in value if v)
+            handler = _SCHEMA_VALUE_HANDLERS.get(type(value))
+            if handler is not None:
+                text = handler(value)
+                if text is not None:
+                    return text
     return None
 
 
@@ -646,7 +912,7 @@ def schema_to_text(schema_data: Dict[str, Any]) -> str:
 # CONTENT CLEANING
 # =============================================================================
 
-def clean_html_content(html: str) -> str:
+def clean_html_content(html: str, container_selector: Optional[str] = None) -> str:
     """
     Clean HTML by removing boilerplate content.
     
@@ -656,36 +922,124 @@ def clean_html_content(html: str) -> str:
     3. Remove HTML comments
     4. Extract and clean text
     5. Remove legal/boilerplate text sections
+    
+    When container_selector (an ATS job container) matches, only that
+    subtree is cleaned; the whole document is cleaned only if the
+    container's text does not pass _is_content_valid.
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    if LexborHTMLParser is not None:
+        return _clean_html_with_selectolax(html, container_selector)
+    
+    # Only build the <body> subtree; reparse fully for body-less fragments
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=BODY_STRAINER)
+    if soup.find('body') is None:
+        soup = BeautifulSoup(html, HTML_PARSER)
+    
+    container = soup.select_one(container_selector) if container_selector else None
+    if container is not None:
+        # Steps 1-3 never remove the container itself, so the whole-document
+        # pass below can still run on the same tree
+        _remove_soup_boilerplate(container)
+        text = _final_cleanup(_remove_legal_sections(container.get_text(separator='\n', strip=True)))
+        if _is_content_valid(text):
+            return text
+    
+    # Steps 1-3: Remove unwanted tags, boilerplate elements and comments
+    _remove_soup_boilerplate(soup)
     
+    # Step 4: Extract text
+    text = _extract_clean_text(soup)
+    
+    # Step 5: Remove legal text sections
+    text = _remove_legal_sections(text)
+    
+    # Final cleanup
+    text = _final_cleanup(text)
+    
+    return text
+
+
+def _remove_soup_boilerplate(scope: Tag) -> None:
+    """Steps 1-3 of clean_html_content on a soup or one of its elements."""
     # Step 1: Remove unwanted tags
     for tag in REMOVE_TAGS:
-        for element in soup.find_all(tag):
+        for element in scope.find_all(tag):
             element.decompose()
     
     # Step 2: Remove elements with boilerplate patterns
-    _remove_boilerplate_elements(soup)
+    _remove_boilerplate_elements(scope)
     
     # Step 3: Remove HTML comments
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+    for comment in scope.find_all(string=lambda text: isinstance(text, Comment)):
         comment.extract()
+
+
+def _clean_html_with_selectolax(html: str, container_selector: Optional[str] = None) -> str:
+    """Same steps as clean_html_content, using the selectolax Lexbor parser."""
+    tree = LexborHTMLParser(html)
     
-    # Step 4: Extract text
-    text = _extract_clean_text(soup)
+    container = tree.css_first(container_selector) if container_selector else None
+    if container is not None:
+        _remove_selectolax_boilerplate(container)
+        text = _final_cleanup(_remove_legal_sections(container.text(separator='\n', strip=True)))
+        if _is_content_valid(text):
+            return text
+    
+    # Steps 1-3: Remove unwanted tags and boilerplate elements (comments are
+    # never part of Lexbor's extracted text, so step 3 is implicit)
+    _remove_selectolax_boilerplate(tree)
+    
+    # Step 4: Extract text from the main content area
+    main_content = (
+        tree.css_first('main') or
+        tree.css_first('article') or
+        tree.css_first('[role="main"]') or
+        tree.css_first(CONTENT_CLASS_SELECTOR) or
+        tree.body or
+        tree.root
+    ) if tree.root is not None else None
+    
+    text = main_content.text(separator='\n', strip=True) if main_content is not None else ""
     
     # Step 5: Remove legal text sections
     text = _remove_legal_sections(text)
     
-    # Final cleanup
-    text = _final_cleanup(text)
+    return _final_cleanup(text)
+
+
+def _remove_selectolax_boilerplate(scope) -> None:
+    """Steps 1-2 of clean_html_content on a Lexbor tree or node (never the node itself)."""
+    # Reverse document order visits descendants before their ancestors, so a
+    # node is never touched after an enclosing match has been decomposed
     
-    return text
+    # Step 1: Remove unwanted tags
+    for node in reversed(scope.css(REMOVE_TAGS_SELECTOR)):
+        if node != scope:
+            node.decompose()
+    
+    # Step 2: Remove elements with boilerplate patterns. Lexbor lists a node
+    # once per attribute selector it matches, so skip repeats rather than
+    # decomposing the same node twice
+    seen = set()
+    for node in reversed(scope.css('[class], [id], [role]')):
+        if node.mem_id in seen or node == scope:
+            continue
+        seen.add(node.mem_id)
+        
+        attrs = node.attributes
+        combined = f"{attrs.get('class') or ''} {attrs.get('id') or ''} {attrs.get('role') or ''}"
+        
+        if BOILERPLATE_REGEX.search(combined):
+            node.decompose()
 
 
 def _remove_boilerplate_elements(soup: BeautifulSoup) -> None:
     """Remove elements that match boilerplate patterns."""
     for element in soup.find_all(True):
+        # Descendants of an element removed earlier in this loop are already gone
+        if element.decomposed:
+            continue
+        
         classes = element.get('class', [])
         if isinstance(classes, list):
             class_str = ' '.join(classes)
@@ -695,6 +1049,10 @@ def _remove_boilerplate_elements(soup: BeautifulSoup) -> None:
         elem_id = element.get('id', '')
         role = element.get('role', '')
         
+        # Most elements carry none of these attributes; skip the regex for them
+        if not (class_str or elem_id or role):
+            continue
+        
         combined = f"{class_str} {elem_id} {role}"
         
         if BOILERPLATE_REGEX.search(combined):
@@ -704,14 +1062,7 @@ def _remove_boilerplate_elements(soup: BeautifulSoup) -> None:
 def _extract_clean_text(soup: BeautifulSoup) -> str:
     """Extract text while preserving some structure."""
     # Find main content area if possible
-    main_content = (
-        soup.find('main') or
-        soup.find('article') or
-        soup.find(attrs={'role': 'main'}) or
-        soup.find(class_=re.compile(r'job|content|description', re.I)) or
-        soup.find('body') or
-        soup
-    )
+    main_content = _find_main_content(soup) or soup.find('body') or soup
     
     # Extract text with newlines for structure
     text = main_content.get_text(separator='\n', strip=True)
@@ -719,13 +1070,68 @@ def _extract_clean_text(soup: BeautifulSoup) -> str:
     return text
 
 
+def _find_main_content(soup: BeautifulSoup) -> Optional[Tag]:
+    """
+    Find the main content element in a single tree walk.
+    
+    Priority: <main>, then <article>, then role="main", then a
+    job/content/description class - first match in document order for each.
+    """
+    article = role_main = content_class = None
+    
+    for element in soup.descendants:
+        if not isinstance(element, Tag):
+            continue
+        if element.name == 'main':
+            return element
+        
+        if article is None and element.name == 'article':
+            article = element
+        if role_main is None and element.get('role') == 'main':
+            role_main = element
+        if content_class is None:
+            classes = element.get('class')
+            if classes and CONTENT_CLASS_REGEX.search(' '.join(classes) if isinstance(classes, list) else classes):
+                content_class = element
+    
+    return article or role_main or content_class
+
+
+def _find_legal_lines(text: str, lines: List[str]) -> set:
+    """Return the indices of lines containing legal text."""
+    # The stdlib engine spends its time matching, not dispatching, so one scan
+    # of the whole text is no faster than a search per line; RE2 is several
+    # times faster on the single scan
+    if isinstance(LEGAL_REGEX, re.Pattern):
+        return {index for index, line in enumerate(lines) if LEGAL_REGEX.search(line)}
+    
+    line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+    legal_lines = set()
+    
+    for match in LEGAL_REGEX.finditer(text):
+        first = bisect_right(line_starts, match.start()) - 1
+        if '\n' not in match.group(0):
+            legal_lines.add(first)
+            continue
+        
+        # \s+ let this match run across a line break; re-check the lines it
+        # covers on their own, as it may also have swallowed a real match
+        last = bisect_right(line_starts, match.end() - 1) - 1
+        for index in range(first, last + 1):
+            if LEGAL_REGEX.search(lines[index]):
+                legal_lines.add(index)
+    
+    return legal_lines
+
+
 def _remove_legal_sections(text: str) -> str:
     """Remove legal disclaimer sections."""
     lines = text.split('\n')
+    legal_lines = _find_legal_lines(text, lines)
     cleaned_lines = []
     skip_until_section = False
     
-    for line in lines:
+    for index, line in enumerate(lines):
         line_stripped = line.strip()
         
         if not line_stripped:
@@ -734,7 +1140,7 @@ def _remove_legal_sections(text: str) -> str:
             continue
         
         # Check if this line starts a legal section
-        if LEGAL_REGEX.search(line_stripped):
+        if index in legal_lines:
             if len(line_stripped) < 100:
                 skip_until_section = True
             continue
@@ -751,40 +1157,38 @@ def _remove_legal_sections(text: str) -> str:
 
 def _final_cleanup(text: str) -> str:
     """Final text cleanup."""
-    # Remove multiple blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # Remove lines that are just punctuation/symbols
-    lines = text.split('\n')
-    cleaned = []
+    # Drop blank lines, very short lines and lines that are just punctuation/symbols
+    # (blank lines go here too, so runs of newlines need no separate collapse)
+    symbol_line = SYMBOL_LINE_REGEX.match
+    text = '\n'.join([
+        line for line in text.split('\n')
+        if len(line.strip()) > 2 and not symbol_line(line)
+    ])
     
-    for line in lines:
-        if line and not re.match(r'^[\s\-\u2022\u00b7*|/\\]+$', line):
-            if len(line.strip()) > 2 or line.strip() == '':
-                cleaned.append(line)
-    
-    text = '\n'.join(cleaned)
-    
-    # Remove excessive whitespace
-    text = re.sub(r'[ \t]+', ' ', text)
-    text = re.sub(r'\n ', '\n', text)
+    # Collapse space/tab runs and drop indentation after newlines in one pass
+    text = WHITESPACE_CLEANUP_REGEX.sub(_whitespace_replacement, text)
     
     return text.strip()
 
 
+def _whitespace_replacement(match: re.Match) -> str:
+    """Newline + indentation becomes a newline; any other run a single space."""
+    return '\n' if match.group()[0] == '\n' else ' '
+
+
 # =============================================================================
 # VALIDATION
 # =============================================================================
 
 def _has_jd_indicators(text: str) -> bool:
     """Check if the text contains keywords indicating a valid job description."""
-    text_lower = text.lower()
-    return any(indicator in text_lower for indicator in JD_INDICATORS)
+    return JD_INDICATOR_REGEX.search(text) is not None
 
 
 def _is_content_valid(text: str) -> bool:
     """Validate that extracted content is likely a real job description."""
-    if not text:
+    # Raw length bounds the stripped length, so check it before copying
+    if not text or len(text) < MIN_CONTENT_LENGTH:
         return False
     
     if len(text.strip()) < MIN_CONTENT_LENGTH:
@@ -810,16 +1214,133 @@ def is_meaningful_content(text: str, min_length: int = 200) -> bool:
     if len(text) < min_length:
         return False
     
-    text_lower = text.lower()
-    matches = sum(1 for kw in JD_INDICATORS if kw in text_lower)
+    # Stop scanning as soon as two distinct indicators have been seen
+    seen = set()
+    for match in JD_INDICATOR_REGEX.finditer(text):
+        seen.add(match.group(0).lower())
+        if len(seen) >= 2:
+            return True
     
-    return matches >= 2
+    return False
 
 
 # =============================================================================
 # FETCHING
 # =============================================================================
 
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session with browser headers and bounded retries."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    
+    retries = Retry(
+        total=REQUEST_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
+    return session
+
+
+# Shared session so repeat fetches reuse TCP/TLS connections per host
+_SESSION = _create_session()
+
+
+def _sniff_encoding(head: bytes) -> Optional[str]:
+    """Return the encoding named by a BOM or <meta charset> in the leading bytes, if any."""
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    
+    match = META_CHARSET_REGEX.search(head)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode('ascii')).name
+        except LookupError:
+            pass
+    
+    return None
+
+
+def _read_response_html(response: requests.Response) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Read a streamed response body and decode it.
+    
+    Stops downloading as soon as a complete JobPosting JSON-LD block with a
+    description has arrived - callers take the schema path for such pages
+    and never look at the rest of the document. Bodies are capped at
+    MAX_HTML_BYTES.
+    
+    Returns:
+        Tuple of (html, schema_data) where schema_data is the JobPosting that
+        ended the download early, or None
+    """
+    # Headers default text/html to ISO-8859-1 when no charset is given; in that
+    # case sniff a BOM or <meta charset>, and only run chardet if both are absent
+    encoding = response.encoding
+    if encoding == 'ISO-8859-1' and 'charset' not in response.headers.get('Content-Type', '').lower():
+        encoding = None
+    sniffed = encoding is not None
+    
+    # A bogus header charset (e.g. "utf8mb4") would fail every decode below
+    if encoding is not None:
+        try:
+            encoding = codecs.lookup(encoding).name
+        except LookupError:
+            encoding = 'utf-8'
+    
+    body = bytearray()
+    schema_data = None
+    # End of the last </script> tag already checked for JSON-LD
+    scanned_end = 0
+    
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        body += chunk
+        if len(body) >= MAX_HTML_BYTES:
+            break
+        
+        if not sniffed and len(body) >= CHARSET_SNIFF_BYTES:
+            encoding = _sniff_encoding(bytes(body[:CHARSET_SNIFF_BYTES]))
+            sniffed = True
+        
+        # Only look for a finished JSON-LD block when a script just closed
+        window_start = max(scanned_end, len(body) - len(chunk) - 16)
+        if b'</script' not in body[window_start:].lower():
+            continue
+        
+        # Check only the scripts closed since the last check, each exactly once
+        pending = bytes(body[scanned_end:]).lower()
+        close = pending.rfind(b'</script')
+        close_end = pending.find(b'>', close)
+        if close_end == -1:
+            continue
+        new_end = scanned_end + close_end + 1
+        closed = bytes(body[scanned_end:new_end])
+        has_json_ld = b'ld+json' in pending[:close_end + 1]
+        scanned_end = new_end
+        
+        if has_json_ld:
+            found = extract_schema_job_posting(closed.decode(encoding or 'utf-8', errors='replace'))
+            if found and found.get('description'):
+                schema_data = found
+                break
+    
+    body = bytes(body)
+    if not sniffed:
+        encoding = _sniff_encoding(body[:CHARSET_SNIFF_BYTES])
+    if encoding is None:
+        encoding = chardet.detect(body)['encoding'] or 'utf-8'
+    
+    try:
+        return body.decode(encoding, errors='replace'), schema_data
+    except LookupError:
+        return body.decode('utf-8', errors='replace'), schema_data
+
+
 def _fetch_with_requests(url: str) -> FetchResult:
     """
     Fetch HTML content from a URL with browser-like headers.
@@ -831,34 +1352,31 @@ def _fetch_with_requests(url: str) -> FetchResult:
         url = 'https://' + url
     
     try:
-        response = requests.get(
+        with _SESSION.get(
             url,
-            headers=DEFAULT_HEADERS,
             timeout=REQUEST_TIMEOUT,
             allow_redirects=True,
-            verify=True
-        )
-        
-        if response.status_code == 200:
-            # Detect encoding
-            if response.encoding is None or response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding
-            
-            return FetchResult(
-                success=True,
-                html=response.text,
-                status_code=response.status_code,
-                error_message=None,
-                final_url=response.url
-            )
-        else:
-            return FetchResult(
-                success=False,
-                html=None,
-                status_code=response.status_code,
-                error_message=f"HTTP {response.status_code}: {response.reason}",
-                final_url=response.url
-            )
+            verify=True,
+            stream=True
+        ) as response:
+            if response.status_code == 200:
+                html, schema_data = _read_response_html(response)
+                return FetchResult(
+                    success=True,
+                    html=html,
+                    status_code=response.status_code,
+                    error_message=None,
+                    final_url=response.url,
+                    schema_data=schema_data
+                )
+            else:
+                return FetchResult(
+                    success=False,
+                    html=None,
+                    status_code=response.status_code,
+                    error_message=f"HTTP {response.status_code}: {response.reason}",
+                    final_url=response.url
+                )
     
     except requests.exceptions.Timeout:
         return FetchResult(False, None, None, f"Request timed out after {REQUEST_TIMEOUT}s", url)
@@ -890,9 +1408,10 @@ def extract_with_trafilatura(html: str, url: str = None) -> str:
     Trafilatura is designed to extract main readable content from web pages,
     removing boilerplate, navigation, and other non-content elements.
     """
+    if trafilatura is None:
+        return ""
+    
     try:
-        import trafilatura
-        
         extracted = trafilatura.extract(
             html,
             url=url,
@@ -907,8 +1426,6 @@ def extract_with_trafilatura(html: str, url: str = None) -> str:
         
         return extracted or ""
     
-    except ImportError:
-        return ""
     except Exception:
         return ""
 
@@ -917,14 +1434,69 @@ def extract_with_trafilatura(html: str, url: str = None) -> str:
 # PLAYWRIGHT (BROWSER) EXTRACTION
 # =============================================================================
 
-def _extract_text_from_container(page, container_selector: str) -> Optional[str]:
-    """Extract text from a specific container in a Playwright page."""
+# Sync Playwright objects are bound to the thread that created them, so each
+# worker thread in this pool owns one warm browser and runs Playwright fetches
+# on it. Every fetch gets a fresh context, so cookies and storage never leak
+# between pages. The Playwright drivers (and their Chromium) exit with the
+# interpreter.
+# Error returned by a Playwright fetch that was cancelled because HTTP won
+PLAYWRIGHT_CANCELLED_ERROR = "Cancelled"
+
+_playwright_executor = ThreadPoolExecutor(max_workers=PLAYWRIGHT_POOL_SIZE, thread_name_prefix="jd-playwright")
+_playwright_state = threading.local()
+_playwright_warm_started = False
+
+# Text of every JSON-LD block that mentions a JobPosting
+JSON_LD_TEXTS_JS = """() => Array.from(
+    document.querySelectorAll('script[type="application/ld+json"]'),
+    script => script.textContent
+).filter(text => text.includes('JobPosting'))"""
+
+# In-page predicate for _wait_for_stable_text. Sampling state lives on window
+# and is reset whenever a new token arrives, i.e. once per wait
+STABLE_TEXT_JS = """([selector, stableSamples, minLength, token]) => {
+    let state = window.__jdStableText;
+    if (!state || state.token !== token) {
+        state = window.__jdStableText = {token, length: -1, same: 0};
+    }
+    const length = document.querySelector(selector)?.innerText?.length || 0;
+    state.same = length === state.length ? state.same + 1 : 1;
+    state.length = length;
+    return state.same >= stableSamples && length >= minLength;
+}"""
+_stable_text_tokens = count()
+
+
+def _extract_best_container_text(page, selectors: List[str], threshold: int) -> Tuple[Optional[str], str]:
+    """
+    Pick the best container text in a single page.evaluate call (see BEST_CONTAINER_TEXT_JS).
+    
+    Returns:
+        Tuple of (selector, text); selector is None when no container had text
+    """
     try:
-        element = page.query_selector(container_selector)
-        if element:
-            return element.inner_text()
+        best = page.evaluate(BEST_CONTAINER_TEXT_JS, [selectors, threshold])
+        return best["selector"], best["text"]
     except Exception:
-        pass
+        return None, ""
+
+
+# Selector whose container last yielded a full description, per (hostname, source)
+_selector_cache = LRUCache(SELECTOR_CACHE_SIZE)
+
+
+def _extract_schema_from_page(page) -> Optional[Dict[str, Any]]:
+    """Read the page's JSON-LD blocks in one page.evaluate call and return the first JobPosting."""
+    try:
+        json_ld_texts = page.evaluate(JSON_LD_TEXTS_JS)
+    except Exception:
+        return None
+    
+    for content in json_ld_texts:
+        job_posting = _job_posting_from_json_ld(content)
+        if job_posting is not None:
+            return job_posting
+    
     return None
 
 
@@ -980,157 +1552,327 @@ def _extract_from_greenhouse_iframe(page) -> Optional[str]:
         return None
 
 
-def _extract_all_page_text(page) -> str:
-    """Extract ALL visible text from the page, including from iframes."""
+def _extract_all_page_text(page, threshold: int = MIN_CONTENT_LENGTH) -> str:
+    """
+    Extract visible text from the page, then from its iframes.
+    
+    Same-origin frames are read first, ad/analytics/captcha frames are
+    skipped, and reading stops once threshold characters are collected.
+    """
     all_text = []
+    total_length = 0
     
     try:
         main_text = page.inner_text("body")
         if main_text:
             all_text.append(main_text)
+            total_length += len(main_text.strip())
     except Exception:
         pass
     
+    if total_length >= threshold:
+        return " ".join(all_text)
+    
     try:
-        frames = page.frames
+        page_origin = urlparse(page.url).netloc
+        frames = [
+            frame for frame in page.frames
+            if frame != page.main_frame and not any(domain in frame.url for domain in SKIPPED_FRAME_DOMAINS)
+        ]
+        frames.sort(key=lambda frame: urlparse(frame.url).netloc != page_origin)
+        
         for frame in frames:
-            if frame != page.main_frame:
-                try:
-                    frame_text = frame.inner_text("body")
-                    if frame_text and len(frame_text.strip()) > 100:
-                        all_text.append(frame_text)
-                except Exception:
-                    continue
+            try:
+                frame_text = frame.inner_text("body")
+                if frame_text and len(frame_text.strip()) > 100:
+                    all_text.append(frame_text)
+                    total_length += len(frame_text.strip())
+                    if total_length >= threshold:
+                        break
+            except Exception:
+                continue
     except Exception:
         pass
     
     return " ".join(all_text)
 
 
+def _get_browser():
+    """
+    Return this worker's browser, launching Chromium if needed.
+    
+    Must only be called on a Playwright worker thread.
+    """
+    browser = getattr(_playwright_state, "browser", None)
+    if browser is None or not browser.is_connected():
+        _close_browser()
+        
+        _playwright_state.playwright = sync_playwright().start()
+        _playwright_state.browser = browser = _playwright_state.playwright.chromium.launch(headless=True, args=CHROMIUM_LAUNCH_ARGS)
+    
+    return browser
+
+
+def _new_browser_context():
+    """
+    Open a fresh browser context on this worker's browser.
+    
+    Must only be called on a Playwright worker thread.
+    """
+    context = _get_browser().new_context(
+        viewport={"width": 1280, "height": 720},
+        user_agent=DEFAULT_HEADERS['User-Agent'],
+    )
+    context.route("**/*", _route_handler)
+    return context
+
+
+def _warm_playwright() -> None:
+    """Launch a browser in the background once, so a later Playwright fallback starts warm."""
+    global _playwright_warm_started
+    
+    if sync_playwright is None or _playwright_warm_started:
+        return
+    _playwright_warm_started = True
+    
+    def warm() -> None:
+        try:
+            _get_browser()
+        except Exception:
+            # Surfaced by the first real Playwright fetch instead
+            _close_browser()
+    
+    _playwright_executor.submit(warm)
+
+
+def _route_handler(route) -> None:
+    """Abort requests for heavy or tracking resources; let the rest through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(domain in request.url for domain in BLOCKED_RESOURCE_DOMAINS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _close_browser() -> None:
+    """Close this worker's browser and stop its Playwright driver, ignoring errors."""
+    browser = getattr(_playwright_state, "browser", None)
+    playwright = getattr(_playwright_state, "playwright", None)
+    _playwright_state.browser = _playwright_state.playwright = None
+    
+    for close in (browser and browser.close, playwright and playwright.stop):
+        if close:
+            try:
+                close()
+            except Exception:
+                pass
+
+
+def _wait_for_stable_text(
+    page,
+    selector: str,
+    interval_ms: int = 200,
+    stable_samples: int = 2,
+    max_ms: int = 2500
+) -> None:
+    """
+    Wait for the text length of a container to stop changing.
+    
+    The sampling runs inside the page via wait_for_function, so there is no
+    CDP round trip per sample. Returns as soon as stable_samples consecutive
+    samples report the same length of at least 200 characters, or once
+    max_ms has elapsed.
+    """
+    try:
+        page.wait_for_function(
+            STABLE_TEXT_JS,
+            arg=[selector, stable_samples, 200, next(_stable_text_tokens)],
+            polling=interval_ms,
+            timeout=max_ms,
+        )
+    except Exception:
+        # Timed out (or the page navigated away) - extract whatever is there
+        pass
+
+
 def _fetch_with_playwright(url: str, source: JobSource) -> Tuple[Optional[str], str]:
     """
     Fetch job description using Playwright for JavaScript-rendered pages.
     
     Uses content-aware waiting instead of networkidle for better reliability
-    with React/SPA pages.
+    with React/SPA pages. Runs on a Playwright worker thread so the
+    browser that worker launched is reused by later calls.
     """
-    try:
-        from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-    except ImportError:
+    if sync_playwright is None:
         return None, "Playwright is not installed. Install with: pip install playwright && playwright install chromium"
     
+    return _wait_for_playwright(_playwright_executor.submit(_fetch_with_playwright_in_worker, url, source))
+
+
+def _wait_for_playwright(future: Future) -> Tuple[Optional[str], str]:
+    """Wait for a submitted Playwright fetch and return its (text, error) result."""
+    try:
+        return future.result()
+    except Exception as e:
+        return None, f"Playwright error: {str(e)}"
+
+
+def _cancel_playwright(future: Optional[Future], cancelled: threading.Event) -> None:
+    """Stop a Playwright fetch whose result is no longer needed, queued or running."""
+    if future is not None:
+        cancelled.set()
+        future.cancel()
+
+
+def _fetch_with_playwright_in_worker(
+    url: str,
+    source: JobSource,
+    cancelled: Optional[threading.Event] = None
+) -> Tuple[Optional[str], str]:
+    """
+    Playwright fetch body; runs on a worker thread that owns a browser.
+    
+    If cancelled is set while the fetch runs, it gives up between steps
+    (navigation, waits, extraction attempts) and frees the worker.
+    """
     MAX_EXTRACTION_ATTEMPTS = 3
-    HYDRATION_DELAY_SECONDS = 2.0
     CONTENT_THRESHOLD = MIN_CONTENT_LENGTH
     
+    def is_cancelled() -> bool:
+        return cancelled is not None and cancelled.is_set()
+    
+    if is_cancelled():
+        return None, PLAYWRIGHT_CANCELLED_ERROR
+    
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            
-            context = browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                user_agent=DEFAULT_HEADERS['User-Agent'],
-            )
-            
-            page = context.new_page()
-            
+        context = _new_browser_context()
+        page = context.new_page()
+    except Exception as e:
+        # Drop a half-started browser so the next call relaunches cleanly
+        _close_browser()
+        return None, f"Playwright error: {str(e)}"
+    
+    try:
+        try:
+            # Content-aware waiting below covers hydration, so don't wait for "load"
+            page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        except PlaywrightTimeout:
+            return None, "Page load timed out (30s)"
+        except Exception as e:
+            return None, f"Navigation error: {str(e)}"
+        
+        if is_cancelled():
+            return None, PLAYWRIGHT_CANCELLED_ERROR
+        
+        # A server-rendered JobPosting makes hydration waits and DOM extraction unnecessary
+        schema_data = _extract_schema_from_page(page)
+        if schema_data and schema_data.get('description'):
+            return schema_to_text(schema_data), ""
+        
+        # The container that won last time on this host is waited for and tried first
+        selector_key = (urlparse(page.url or url).hostname or "", source)
+        cached_selector = _selector_cache.get(selector_key)
+        if cached_selector is not None:
             try:
-                page.goto(url, wait_until="load", timeout=30000)
-            except PlaywrightTimeout:
-                browser.close()
-                return None, "Page load timed out (30s)"
-            except Exception as e:
-                browser.close()
-                return None, f"Navigation error: {str(e)}"
-            
-            # Wait for semantic containers
-            for container in SEMANTIC_CONTAINERS:
-                try:
-                    page.wait_for_selector(container, timeout=15000)
-                    break
-                except Exception:
-                    continue
-            
-            # Hydration delay for SPAs
-            time.sleep(HYDRATION_DELAY_SECONDS)
+                page.wait_for_selector(cached_selector, timeout=3000)
+            except Exception:
+                _selector_cache.discard(selector_key)
+                cached_selector = None
+        
+        if cached_selector is not None:
+            settle_selector = cached_selector
+        else:
+            # Wait for a semantic container (body exists once the DOM has loaded)
+            try:
+                page.wait_for_selector(SEMANTIC_CONTAINER_SELECTOR, timeout=15000)
+                settle_selector = SEMANTIC_CONTAINER_SELECTOR
+            except Exception:
+                settle_selector = "body"
             
-            extracted_text = ""
+            if source in ATS_SELECTORS:
+                settle_selector = ATS_SELECTORS[source]["selector"]
+        
+        if is_cancelled():
+            return None, PLAYWRIGHT_CANCELLED_ERROR
+        
+        # Let SPAs hydrate: poll the settle container until its text stops growing
+        _wait_for_stable_text(page, settle_selector)
+        
+        # Cached and ATS containers first, then semantic containers, all read in one round trip
+        candidate_selectors = list(dict.fromkeys(
+            ([cached_selector] if cached_selector else []) +
+            ([ATS_SELECTORS[source]["selector"]] if source in ATS_SELECTORS else []) +
+            SEMANTIC_CONTAINERS
+        ))
+        
+        extracted_text = ""
+        extracted_length = 0
+        winning_selector = None
+        
+        for attempt in range(MAX_EXTRACTION_ATTEMPTS):
+            if is_cancelled():
+                return None, PLAYWRIGHT_CANCELLED_ERROR
             
-            for attempt in range(MAX_EXTRACTION_ATTEMPTS):
-                # Greenhouse iframe handling
-                if source == "greenhouse":
-                    iframe_text = _extract_from_greenhouse_iframe(page)
-                    if iframe_text and len(iframe_text.strip()) > len(extracted_text.strip()):
-                        extracted_text = iframe_text
-                        if len(extracted_text.strip()) >= CONTENT_THRESHOLD:
-                            break
-                    
-                    if not extracted_text or len(extracted_text.strip()) < 200:
-                        try:
-                            page.wait_for_selector("#content", timeout=3000)
-                            greenhouse_text = _extract_text_from_container(page, "#content")
-                            if greenhouse_text and len(greenhouse_text.strip()) > 200:
-                                extracted_text = greenhouse_text
-                                if len(extracted_text.strip()) >= CONTENT_THRESHOLD:
-                                    break
-                        except Exception:
-                            pass
-                
-                # Try ATS-specific selectors
-                if not extracted_text or len(extracted_text.strip()) < 200:
-                    if source != "generic" and source in ATS_SELECTORS:
-                        selector = ATS_SELECTORS[source]["selector"]
-                        try:
-                            page.wait_for_selector(selector, timeout=3000)
-                            ats_text = _extract_text_from_container(page, selector)
-                            if ats_text and len(ats_text.strip()) > len(extracted_text.strip()):
-                                extracted_text = ats_text
-                                if len(extracted_text.strip()) >= CONTENT_THRESHOLD:
-                                    break
-                        except Exception:
-                            pass
-                
-                # Semantic container extraction
-                if not extracted_text or len(extracted_text.strip()) < CONTENT_THRESHOLD:
-                    for container in SEMANTIC_CONTAINERS:
-                        container_text = _extract_text_from_container(page, container)
-                        if container_text and len(container_text.strip()) > len(extracted_text.strip()):
-                            extracted_text = container_text
-                            if len(extracted_text.strip()) >= CONTENT_THRESHOLD:
-                                break
-                    
-                    if len(extracted_text.strip()) >= CONTENT_THRESHOLD:
+            # Greenhouse embeds are cross-origin iframes, which page JS cannot read
+            if source == "greenhouse":
+                iframe_text = _extract_from_greenhouse_iframe(page)
+                if iframe_text and len(iframe_text.strip()) > extracted_length:
+                    extracted_text = iframe_text
+                    extracted_length = len(iframe_text.strip())
+                    winning_selector = None
+                    if extracted_length >= CONTENT_THRESHOLD:
                         break
-                
-                # Last resort: all page text
-                if not extracted_text or len(extracted_text.strip()) < 200:
-                    all_text = _extract_all_page_text(page)
-                    if all_text and len(all_text.strip()) > len(extracted_text.strip()):
-                        extracted_text = all_text
-                        if len(extracted_text.strip()) >= CONTENT_THRESHOLD:
-                            break
-                
-                if attempt < MAX_EXTRACTION_ATTEMPTS - 1:
-                    time.sleep(1.0)
             
-            browser.close()
+            # First container that reaches the threshold, else the longest
+            container_selector, container_text = _extract_best_container_text(page, candidate_selectors, CONTENT_THRESHOLD)
+            if len(container_text.strip()) > extracted_length:
+                extracted_text = container_text
+                extracted_length = len(container_text.strip())
+                winning_selector = container_selector
             
-            # Clean the extracted text
-            cleaned_text = _final_cleanup(extracted_text) if extracted_text else ""
+            if extracted_length >= CONTENT_THRESHOLD:
+                break
             
-            if len(cleaned_text) < 200:
-                return None, f"Content too short after {MAX_EXTRACTION_ATTEMPTS} attempts ({len(cleaned_text)} chars)"
-            
-            return cleaned_text, ""
+            # Last resort: all page text
+            if extracted_length < 200:
+                all_text = _extract_all_page_text(page)
+                if all_text and len(all_text.strip()) > extracted_length:
+                    extracted_text = all_text
+                    extracted_length = len(all_text.strip())
+                    winning_selector = None
+                    if extracted_length >= CONTENT_THRESHOLD:
+                        break
             
-    except Exception as e:
-        return None, f"Playwright error: {str(e)}"
+            if attempt < MAX_EXTRACTION_ATTEMPTS - 1:
+                _wait_for_stable_text(page, settle_selector, max_ms=1000)
+    finally:
+        try:
+            context.close()
+        except Exception:
+            pass
+    
+    # Remember a container that yielded a full description; drop one that no longer does
+    if winning_selector is not None and extracted_length >= CONTENT_THRESHOLD:
+        _selector_cache.put(selector_key, winning_selector)
+    elif cached_selector is not None:
+        _selector_cache.discard(selector_key)
+    
+    # Clean the extracted text
+    cleaned_text = _final_cleanup(extracted_text) if extracted_text else ""
+    
+    if len(cleaned_text) < 200:
+        return None, f"Content too short after {MAX_EXTRACTION_ATTEMPTS} attempts ({len(cleaned_text)} chars)"
+    
+    return cleaned_text, ""
 
 
 # =============================================================================
 # MAIN EXTRACTION FUNCTION
 # =============================================================================
 
+_fetch_cache = LRUCache(FETCH_CACHE_SIZE, ttl=FETCH_CACHE_TTL_SECONDS)
+
+
 def fetch_job_description(url: str, mode: str = "auto") -> Dict:
     """
     Fetch and extract job description text from a URL.
@@ -1170,7 +1912,23 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
         raise ValueError(f"Invalid mode '{mode}'. Must be one of: {valid_modes}")
     
     url = url.strip()
+    cache_key = (url, mode)
     
+    cached = _fetch_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    result = _fetch_job_description_uncached(url, mode)
+    
+    # Only cache clean results so failed or partial fetches are retried
+    if not result["error"]:
+        _fetch_cache.put(cache_key, result)
+    
+    return result
+
+
+def _fetch_job_description_uncached(url: str, mode: str) -> Dict:
+    """Run the extraction pipeline for an already validated URL and mode."""
     # Detect ATS platform
     source = detect_source(url)
     
@@ -1190,6 +1948,9 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
     # Use resolved URL for fetching
     fetch_url_to_use = resolved_url if was_resolved else url
     
+    # Known ATS pages keep the posting in a fixed container; clean just that
+    container_selector = ATS_SELECTORS[source]["selector"] if source in ATS_SELECTORS else None
+    
     # =========================================================================
     # MODE: requests only
     # =========================================================================
@@ -1207,7 +1968,7 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
                 return result
         
         # Try Schema.org extraction first
-        schema_data = extract_schema_job_posting(fetch_result.html)
+        schema_data = fetch_result.schema_data or extract_schema_job_posting(fetch_result.html)
         if schema_data and schema_data.get('description'):
             result["schema_data"] = schema_data
             result["raw_text"] = schema_to_text(schema_data)
@@ -1215,7 +1976,7 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
             return result
         
         # Fall back to content cleaning
-        cleaned_text = clean_html_content(fetch_result.html)
+        cleaned_text = clean_html_content(fetch_result.html, container_selector)
         result["raw_text"] = cleaned_text
         
         if not _is_content_valid(cleaned_text):
@@ -1248,6 +2009,18 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
     # MODE: auto (hybrid) - default behavior
     # =========================================================================
     
+    # JS-heavy platforms almost always end up in Playwright, so start the
+    # browser fetch now and let it overlap the HTTP attempt below; for other
+    # pages, which only sometimes fall back to it, just warm up a browser
+    playwright_future = None
+    playwright_cancelled = threading.Event()
+    if source in JS_HEAVY_SOURCES and sync_playwright is not None:
+        playwright_future = _playwright_executor.submit(
+            _fetch_with_playwright_in_worker, fetch_url_to_use, source, playwright_cancelled
+        )
+    else:
+        _warm_playwright()
+    
     # STEP 1: Try HTTP fetch
     fetch_result = _fetch_with_requests(fetch_url_to_use)
     
@@ -1257,19 +2030,22 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
     
     if fetch_result.success:
         # STEP 2: Try Schema.org extraction (most reliable)
-        schema_data = extract_schema_job_posting(fetch_result.html)
+        schema_data = fetch_result.schema_data or extract_schema_job_posting(fetch_result.html)
         if schema_data and schema_data.get('description'):
             result["schema_data"] = schema_data
             result["raw_text"] = schema_to_text(schema_data)
             result["source"] = "schema"
+            # The HTTP path won, so free the browser worker
+            _cancel_playwright(playwright_future, playwright_cancelled)
             return result
         
         # STEP 3: Try content cleaning
-        cleaned_text = clean_html_content(fetch_result.html)
+        cleaned_text = clean_html_content(fetch_result.html, container_selector)
         
         if _is_content_valid(cleaned_text):
             result["source"] = "requests"
             result["raw_text"] = cleaned_text
+            _cancel_playwright(playwright_future, playwright_cancelled)
             return result
         
         # STEP 4: Try trafilatura
@@ -1277,10 +2053,14 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
         if is_meaningful_content(traf_text, 500):
             result["source"] = "trafilatura"
             result["raw_text"] = traf_text
+            _cancel_playwright(playwright_future, playwright_cancelled)
             return result
     
     # STEP 5: Fall back to Playwright
-    playwright_text, playwright_error = _fetch_with_playwright(fetch_url_to_use, source)
+    if playwright_future is not None:
+        playwright_text, playwright_error = _wait_for_playwright(playwright_future)
+    else:
+        playwright_text, playwright_error = _fetch_with_playwright(fetch_url_to_use, source)
     
     if playwright_text and len(playwright_text.strip()) > 200:
         result["source"] = "playwright"
@@ -1288,10 +2068,8 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
         return result
     
     # Both methods failed - return best available content
+    # (cleaned_text and traf_text were already computed in steps 3 and 4)
     if fetch_result.success:
-        cleaned_text = clean_html_content(fetch_result.html)
-        traf_text = extract_with_trafilatura(fetch_result.html, fetch_url_to_use)
-        
         best_text = cleaned_text if len(cleaned_text) > len(traf_text or "") else (traf_text or cleaned_text)
         
         if best_text:
@@ -1305,3 +2083,109 @@ def fetch_job_description(url: str, mode: str = "auto") -> Dict:
     result["error"] = f"Failed to extract content. HTTP: {fetch_result.error_message if not fetch_result.success else 'OK but short'}. Playwright: {playwright_error}"
     
     return result
+
+
+def fetch_job_descriptions(urls: List[str], mode: str = "auto", max_workers: int = MAX_CONCURRENT_FETCHES) -> List[Dict]:
+    """
+    Fetch several job descriptions concurrently.
+    
+    Each URL is fetched with fetch_job_description() on a thread pool, so
+    the network waits overlap instead of running back to back.
+    
+    Args:
+        urls: Job posting URLs to fetch
+        mode: Extraction mode - "auto", "requests", or "playwright"
+        max_workers: Maximum number of concurrent fetches
+    
+    Returns:
+        List of fetch_job_description() results, in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    # Fetch each distinct URL once; duplicates would all miss the cache together
+    unique_urls = list(dict.fromkeys(url.strip() for url in urls))
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls)), thread_name_prefix="jd-fetch") as executor:
+        fetched = dict(zip(unique_urls, executor.map(lambda url: fetch_job_description(url, mode), unique_urls)))
+    
+    return [copy.deepcopy(fetched[url.strip()]) for url in urls]
+
+
+# =============================================================================
+# BACKGROUND PREFETCH
+# =============================================================================
+
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jd-prefetch")
+# (url, mode) -> (time.monotonic() when started, future)
+_prefetch_futures: Dict[Tuple[str, str], Tuple[float, Future]] = {}
+_prefetch_lock = threading.Lock()
+
+
+def prefetch_job_description(url: str, mode: str = "auto") -> None:
+    """
+    Start fetching a job description in a background thread.
+    
+    The result is kept until claimed with take_prefetched_job_description(),
+    for at most FETCH_CACHE_TTL_SECONDS. Repeated calls for the same URL and
+    mode do not start a second fetch while the first is still fresh.
+    
+    Args:
+        url: The job posting URL to fetch
+        mode: Extraction mode - "auto", "requests", or "playwright"
+    """
+    if not url or not url.strip():
+        return
+    
+    key = (url.strip(), mode)
+    now = time.monotonic()
+    
+    with _prefetch_lock:
+        # Prefetches nobody claimed (e.g. Streamlit served its own cache) expire like cached fetches
+        for stale_key in [k for k, (started_at, _) in _prefetch_futures.items() if now - started_at > FETCH_CACHE_TTL_SECONDS]:
+            _prefetch_futures.pop(stale_key)[1].cancel()
+        
+        if key in _prefetch_futures:
+            return
+        
+        # Drop the oldest entries so abandoned URLs don't pile up
+        while len(_prefetch_futures) >= MAX_PREFETCH_ENTRIES:
+            oldest_key = next(iter(_prefetch_futures))
+            _prefetch_futures.pop(oldest_key)[1].cancel()
+        
+        _prefetch_futures[key] = (now, _prefetch_executor.submit(fetch_job_description, url, mode))
+
+
+def take_prefetched_job_description(url: str, mode: str = "auto") -> Optional[Dict]:
+    """
+    Claim a prefetched job description, waiting for it if still in flight.
+    
+    Args:
+        url: The job posting URL that was prefetched
+        mode: Extraction mode used for the prefetch
+    
+    Returns:
+        The fetch_job_description() result, or None if nothing was prefetched,
+        the prefetch is older than FETCH_CACHE_TTL_SECONDS, or it failed
+        (including results with an "error", which callers should refetch
+        rather than reuse, as fetch_job_description() does not cache them)
+    """
+    if not url or not url.strip():
+        return None
+    
+    with _prefetch_lock:
+        entry = _prefetch_futures.pop((url.strip(), mode), None)
+    
+    if entry is None:
+        return None
+    
+    started_at, future = entry
+    if future.cancelled() or time.monotonic() - started_at > FETCH_CACHE_TTL_SECONDS:
+        return None
+    
+    try:
+        result = future.result()
+    except Exception:
+        return None
+    
+    return None if result.get("error") else result
@@ -6,7 +6,64 @@ Uses string replacement only - no LaTeX generation, no GPT.
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+
+# Section names, in priority order
+EXPERIENCE_SECTION_NAMES = [
+    "Professional Experience",
+    "Experience",
+    "Work Experience"
+]
+
+SKILLS_SECTION_NAMES = [
+    "Skills",
+    "Technical Skills",
+    "Core Competencies"
+]
+
+NEXT_SECTION_PATTERN = re.compile(r'\\section\{')
+SECTION_HEADER_PATTERN = re.compile(r'\\section\{[^}]+\}')
+NEXT_SUBHEADING_PATTERN = re.compile(r'\\resumeSubheading\{')
+SUBHEADING_PATTERN = re.compile(r'\\resumeSubheading\{([^}]*)\}\{([^}]*)\}')
+
+# Bullet patterns
+RESUME_ITEM_PATTERN = re.compile(r'\\resumeItem\{[^}]+\}')
+ITEM_PATTERN = re.compile(r'(\\item\s+)([^\n\\]+?)(?=\\item|\\end\{|$)', re.MULTILINE | re.DOTALL)
+ITEMIZE_PATTERN = re.compile(r'(\\begin\{itemize\})(.*?)(\\end\{itemize\})', re.DOTALL)
+
+
+def _scan_sections(content: str) -> Dict[str, Tuple[int, int]]:
+    r"""
+    Map each \section{Name} to its boundaries in a single pass.
+    
+    A section runs from its header to the next \section{ or the end of the
+    document. When a name appears more than once, the first one wins.
+    
+    Returns:
+        Dictionary of name -> (start_pos, end_pos)
+    """
+    headers = list(NEXT_SECTION_PATTERN.finditer(content))
+    sections = {}
+    
+    for i, header in enumerate(headers):
+        name_end = content.find('}', header.end())
+        if name_end == -1:
+            continue
+        end_pos = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        sections.setdefault(content[header.end():name_end], (header.start(), end_pos))
+    
+    return sections
+
+
+def _find_section(content: str, section_names: List[str], sections: Dict[str, Tuple[int, int]]) -> tuple:
+    """Return (start_pos, end_pos, section_content) for the first name present, else Nones."""
+    for name in section_names:
+        if name in sections:
+            start_pos, end_pos = sections[name]
+            return (start_pos, end_pos, content[start_pos:end_pos])
+    
+    return (None, None, None)
 
 
 def find_experience_section(content: str) -> tuple:
@@ -16,27 +73,7 @@ def find_experience_section(content: str) -> tuple:
     Returns:
         (start_pos, end_pos, section_content) or (None, None, None) if not found
     """
-    section_names = [
-        "Professional Experience",
-        "Experience",
-        "Work Experience"
-    ]
-    
-    for section_name in section_names:
-        escaped_name = re.escape(section_name)
-        pattern = rf'\\section\{{{escaped_name}\}}'
-        match = re.search(pattern, content)
-        if match:
-            start_pos = match.start()
-            # Find next section or end of document
-            next_section = re.search(r'\\section\{', content[match.end():])
-            if next_section:
-                end_pos = match.end() + next_section.start()
-            else:
-                end_pos = len(content)
-            return (start_pos, end_pos, content[start_pos:end_pos])
-    
-    return (None, None, None)
+    return _find_section(content, EXPERIENCE_SECTION_NAMES, _scan_sections(content))
 
 
 def find_skills_section(content: str) -> tuple:
@@ -46,27 +83,42 @@ def find_skills_section(content: str) -> tuple:
     Returns:
         (start_pos, end_pos, section_content) or (None, None, None) if not found
     """
-    section_names = [
-        "Skills",
-        "Technical Skills",
-        "Core Competencies"
-    ]
-    
-    for section_name in section_names:
-        escaped_name = re.escape(section_name)
-        pattern = rf'\\section\{{{escaped_name}\}}'
-        match = re.search(pattern, content)
-        if match:
-            start_pos = match.start()
-            # Find next section or end of document
-            next_section = re.search(r'\\section\{', content[match.end():])
-            if next_section:
-                end_pos = match.end() + next_section.start()
-            else:
-                end_pos = len(content)
-            return (start_pos, end_pos, content[start_pos:end_pos])
+    return _find_section(content, SKILLS_SECTION_NAMES, _scan_sections(content))
+
+
+def _splice_matches(
+    text: str,
+    matches: List[re.Match],
+    replacements: List[str],
+    additional_items: List[str]
+) -> str:
+    """
+    Rebuild text with each match swapped for its replacement, in one pass.
     
-    return (None, None, None)
+    Works from the match offsets, so identical items are each replaced in
+    place and inserted text is never searched again.
+    
+    Args:
+        text: Text the matches were found in
+        matches: Non-overlapping matches in document order
+        replacements: Replacement text for each match ('' removes it)
+        additional_items: Lines to insert after the last match, if any
+        
+    Returns:
+        Updated text
+    """
+    chunks = []
+    pos = 0
+    for match, replacement in zip(matches, replacements):
+        chunks.append(text[pos:match.start()])
+        chunks.append(replacement)
+        pos = match.end()
+    
+    if additional_items:
+        chunks.append('\n' + '\n'.join(additional_items))
+    
+    chunks.append(text[pos:])
+    return ''.join(chunks)
 
 
 def replace_bullets_in_experience_block(exp_content: str, new_bullets: List[str]) -> str:
@@ -86,67 +138,28 @@ def replace_bullets_in_experience_block(exp_content: str, new_bullets: List[str]
     result = exp_content
     
     # Find all \resumeItem{...} in this experience block
-    resume_item_pattern = r'\\resumeItem\{[^}]+\}'
-    resume_items = list(re.finditer(resume_item_pattern, result))
+    resume_items = list(RESUME_ITEM_PATTERN.finditer(result))
     
     if resume_items:
-        # Replace existing resumeItems
-        if len(new_bullets) <= len(resume_items):
-            # Replace first N items
-            for i, match in enumerate(resume_items[:len(new_bullets)]):
-                old_item = match.group(0)
-                new_item = f'\\resumeItem{{{new_bullets[i]}}}'
-                result = result.replace(old_item, new_item, 1)
-            # Remove extra items if we have fewer new bullets
-            if len(new_bullets) < len(resume_items):
-                for match in resume_items[len(new_bullets):]:
-                    old_item = match.group(0)
-                    result = result.replace(old_item, '', 1)
-        else:
-            # Replace all existing and add new ones
-            for i, match in enumerate(resume_items):
-                old_item = match.group(0)
-                new_item = f'\\resumeItem{{{new_bullets[i]}}}'
-                result = result.replace(old_item, new_item, 1)
-            # Add remaining new bullets after the last one
-            last_match = resume_items[-1]
-            insert_pos = last_match.end()
-            additional_items = '\n'.join([
-                f'\\resumeItem{{{bullet}}}'
-                for bullet in new_bullets[len(resume_items):]
-            ])
-            result = result[:insert_pos] + '\n' + additional_items + result[insert_pos:]
+        # Replace existing resumeItems in order, removing extras and
+        # appending any remaining bullets after the last one
+        replacements = [f'\\resumeItem{{{bullet}}}' for bullet in new_bullets[:len(resume_items)]]
+        replacements += [''] * (len(resume_items) - len(replacements))
+        additional_items = [f'\\resumeItem{{{bullet}}}' for bullet in new_bullets[len(resume_items):]]
+        result = _splice_matches(result, resume_items, replacements, additional_items)
     else:
         # Try to find \item entries (for itemize environments)
-        item_pattern = r'(\\item\s+)([^\n\\]+?)(?=\\item|\\end\{|$)'
-        item_matches = list(re.finditer(item_pattern, result, re.MULTILINE | re.DOTALL))
+        item_matches = list(ITEM_PATTERN.finditer(result))
         
         if item_matches:
-            # Replace items
-            if len(new_bullets) <= len(item_matches):
-                for i, match in enumerate(item_matches[:len(new_bullets)]):
-                    old_item = match.group(0)
-                    new_item = match.group(1) + new_bullets[i]
-                    result = result.replace(old_item, new_item, 1)
-                # Remove extra items
-                if len(new_bullets) < len(item_matches):
-                    for match in item_matches[len(new_bullets):]:
-                        old_item = match.group(0)
-                        result = result.replace(old_item, '', 1)
-            else:
-                # Replace all and add new
-                for i, match in enumerate(item_matches):
-                    old_item = match.group(0)
-                    new_item = match.group(1) + new_bullets[i]
-                    result = result.replace(old_item, new_item, 1)
-                # Add remaining
-                last_match = item_matches[-1]
-                insert_pos = last_match.end()
-                additional_items = '\n'.join([
-                    f'\\item {bullet}'
-                    for bullet in new_bullets[len(item_matches):]
-                ])
-                result = result[:insert_pos] + '\n' + additional_items + result[insert_pos:]
+            # Replace items the same way, keeping each item's \item prefix
+            replacements = [
+                match.group(1) + bullet
+                for match, bullet in zip(item_matches, new_bullets)
+            ]
+            replacements += [''] * (len(item_matches) - len(replacements))
+            additional_items = [f'\\item {bullet}' for bullet in new_bullets[len(item_matches):]]
+            result = _splice_matches(result, item_matches, replacements, additional_items)
         else:
             # No existing bullets found, add new ones after subheading
             # Find where to insert (after any date/location info)
@@ -162,6 +175,30 @@ def replace_bullets_in_experience_block(exp_content: str, new_bullets: List[str]
     return result
 
 
+def _index_subheadings(experience_section: str) -> Dict[Tuple[str, str], Tuple[int, int]]:
+    r"""
+    Map each \resumeSubheading{role}{company} to the content that follows it.
+    
+    The content runs from the end of {company} up to the next
+    \resumeSubheading{ (or the end of the section), so it still starts
+    with the {date}{location} arguments. The first subheading wins when a
+    role and company repeat.
+    
+    Returns:
+        Dictionary of (role, company) -> (start_pos, end_pos)
+    """
+    starts = [match.start() for match in NEXT_SUBHEADING_PATTERN.finditer(experience_section)]
+    subheadings = {}
+    
+    for i, start in enumerate(starts):
+        match = SUBHEADING_PATTERN.match(experience_section, start)
+        if match:
+            end_pos = starts[i + 1] if i + 1 < len(starts) else len(experience_section)
+            subheadings.setdefault(match.groups(), (match.end(), end_pos))
+    
+    return subheadings
+
+
 def replace_experiences_in_section(
     experience_section: str,
     updated_experiences: Dict
@@ -183,7 +220,8 @@ def replace_experiences_in_section(
     Returns:
         Updated experience section
     """
-    result = experience_section
+    subheadings = _index_subheadings(experience_section)
+    updated_blocks = {}
     
     # Process each experience
     for exp_key, exp_data in updated_experiences.items():
@@ -194,36 +232,26 @@ def replace_experiences_in_section(
                 # Find the subheading for this experience
                 role = exp_data.get('role', '')
                 company = exp_data.get('company', '')
+                key = (role, company)
                 
-                if role and company:
-                    # Find the subheading (escape special regex chars)
-                    escaped_role = re.escape(role)
-                    escaped_company = re.escape(company)
-                    # Match \resumeSubheading{role}{company}{date}{location}
-                    subheading_pattern = rf'\\resumeSubheading\{{{escaped_role}\}}\{{{escaped_company}\}}'
-                    subheading_match = re.search(subheading_pattern, result)
+                if role and company and key in subheadings:
+                    start_pos, end_pos = subheadings[key]
+                    exp_content = updated_blocks.get(key, experience_section[start_pos:end_pos])
                     
-                    if subheading_match:
-                        # Find the content after this subheading until next subheading
-                        start_pos = subheading_match.end()
-                        next_subheading = re.search(r'\\resumeSubheading\{', result[start_pos:])
-                        if next_subheading:
-                            end_pos = start_pos + next_subheading.start()
-                        else:
-                            end_pos = len(result)
-                        
-                        exp_content = result[start_pos:end_pos]
-                        
-                        # Replace all bullets in this experience's content
-                        updated_exp_content = replace_bullets_in_experience_block(
-                            exp_content,
-                            new_bullets
-                        )
-                        
-                        # Replace in result
-                        result = result[:start_pos] + updated_exp_content + result[end_pos:]
+                    # Replace all bullets in this experience's content
+                    updated_blocks[key] = replace_bullets_in_experience_block(exp_content, new_bullets)
     
-    return result
+    # Splice the updated blocks back in document order
+    chunks = []
+    pos = 0
+    for key in sorted(updated_blocks, key=subheadings.get):
+        start_pos, end_pos = subheadings[key]
+        chunks.append(experience_section[pos:start_pos])
+        chunks.append(updated_blocks[key])
+        pos = end_pos
+    chunks.append(experience_section[pos:])
+    
+    return ''.join(chunks)
 
 
 def replace_skills_in_section(skills_section: str, updated_skills: List[str]) -> str:
@@ -243,41 +271,19 @@ def replace_skills_in_section(skills_section: str, updated_skills: List[str]) ->
     result = skills_section
     
     # Find all \resumeItem{...} in skills section
-    resume_item_pattern = r'\\resumeItem\{[^}]+\}'
-    resume_items = list(re.finditer(resume_item_pattern, result))
+    resume_items = list(RESUME_ITEM_PATTERN.finditer(result))
     
     # Replace existing resumeItems with new skills
     if resume_items:
-        # Replace each resumeItem with new skills
-        replacements = []
-        for i, skill in enumerate(updated_skills):
-            if i < len(resume_items):
-                # Replace the content of this resumeItem
-                match = resume_items[i]
-                old_item = match.group(0)
-                new_item = f'\\resumeItem{{{skill}}}'
-                replacements.append((old_item, new_item))
-        
-        # Apply replacements
-        for old, new in replacements:
-            result = result.replace(old, new, 1)
-        
-        # If we have more skills than existing items, add them
-        if len(updated_skills) > len(resume_items):
-            # Find the last resumeItem or itemize environment
-            last_item_match = resume_items[-1] if resume_items else None
-            if last_item_match:
-                # Add new items after the last one
-                insert_pos = last_item_match.end()
-                additional_items = '\n'.join([
-                    f'\\resumeItem{{{skill}}}'
-                    for skill in updated_skills[len(resume_items):]
-                ])
-                result = result[:insert_pos] + '\n' + additional_items + result[insert_pos:]
+        # Replace items in order; items beyond the new skills are kept, and
+        # extra skills are added after the last item
+        replacements = [f'\\resumeItem{{{skill}}}' for skill in updated_skills[:len(resume_items)]]
+        replacements += [match.group(0) for match in resume_items[len(replacements):]]
+        additional_items = [f'\\resumeItem{{{skill}}}' for skill in updated_skills[len(resume_items):]]
+        result = _splice_matches(result, resume_items, replacements, additional_items)
     else:
         # No existing resumeItems, try to find itemize environment
-        itemize_pattern = r'(\\begin\{itemize\})(.*?)(\\end\{itemize\})'
-        itemize_match = re.search(itemize_pattern, result, re.DOTALL)
+        itemize_match = ITEMIZE_PATTERN.search(result)
         
         if itemize_match:
             # Replace items inside itemize
@@ -286,7 +292,7 @@ def replace_skills_in_section(skills_section: str, updated_skills: List[str]) ->
             result = result[:itemize_match.start()] + new_itemize + result[itemize_match.end():]
         else:
             # No existing structure, add resumeItems after section header
-            section_header_match = re.search(r'\\section\{[^}]+\}', result)
+            section_header_match = SECTION_HEADER_PATTERN.search(result)
             if section_header_match:
                 insert_pos = section_header_match.end()
                 items_text = '\n'.join([f'\\resumeItem{{{skill}}}' for skill in updated_skills])
@@ -318,19 +324,25 @@ def update_latex_resume(
     Returns:
         Updated LaTeX resume content
     """
-    result = original_latex
+    # Both sections are located with one scan of the original document
+    sections = _scan_sections(original_latex)
+    exp_start, exp_end, exp_section = _find_section(original_latex, EXPERIENCE_SECTION_NAMES, sections)
+    skills_start, skills_end, skills_section = _find_section(original_latex, SKILLS_SECTION_NAMES, sections)
+    
+    # Sections never overlap, so each update is a (start, end, new_text) splice
+    updates = []
     
     # Update Experience section
-    exp_start, exp_end, exp_section = find_experience_section(result)
     if exp_section:
-        updated_exp_section = replace_experiences_in_section(exp_section, updated_experiences)
-        result = result[:exp_start] + updated_exp_section + result[exp_end:]
+        updates.append((exp_start, exp_end, replace_experiences_in_section(exp_section, updated_experiences)))
     
     # Update Skills section
-    skills_start, skills_end, skills_section = find_skills_section(result)
     if skills_section:
-        updated_skills_section = replace_skills_in_section(skills_section, updated_skills)
-        result = result[:skills_start] + updated_skills_section + result[skills_end:]
+        updates.append((skills_start, skills_end, replace_skills_in_section(skills_section, updated_skills)))
+    
+    # Apply from the end of the document so earlier offsets stay valid
+    result = original_latex
+    for start_pos, end_pos, updated_section in sorted(updates, reverse=True):
+        result = result[:start_pos] + updated_section + result[end_pos:]
     
     return result
-
@@ -5,9 +5,61 @@ Extracts experience and skills sections from LaTeX resume files.
 Uses regex only - no GPT, deterministic, does not modify LaTeX.
 """
 
+import os
 import re
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+# Shared LRU cache helper
+from utils._cache import LRUCache
+
+
+# Extraction results reused for unchanged files
+EXTRACTION_CACHE_SIZE = 64
+
+# Section boundaries
+NEXT_SECTION_PATTERN = re.compile(r'\\(?:section|resumeSection)\*?\s*\{', re.IGNORECASE)
+END_DOCUMENT_PATTERN = re.compile(r'\\end\{document\}')
+
+# Experience headings and the commands that end an experience's bullets
+SUBHEADING_PATTERN = re.compile(r'\\resumeSubheading\s*\{')
+# Group 1 names the heading command, group 2 is set for \resumeItemListEnd
+HEADING_BOUNDARY_PATTERN = re.compile(
+    r'\\(resumeSubheading|resumeProjectHeading)\s*\{|\\resumeSubHeadingListEnd|(\\resumeItemListEnd)'
+)
+
+# Bullets and skills
+RESUME_ITEM_PATTERN = re.compile(r'\\resumeItem\s*\{')
+ITEM_COMMAND = '\\item'
+ITEM_LIST_END_MARKERS = ('\\end{', '\\resumeItemListEnd')
+BOLD_CATEGORY_PATTERN = re.compile(r'\\textbf\{([^}]+)\}\s*:?\s*([^\\]+)')
+SKILLS_BLOCK_PATTERN = re.compile(r'(Languages|Tools|Frameworks|Technologies)\s*:', re.IGNORECASE)
+
+# clean_latex_text steps, applied in this order
+TEXT_FORMAT_PATTERN = re.compile(r'\\(?:textbf|textit|emph|underline|textsc|textsf|texttt)\{([^}]*)\}')
+HREF_PATTERN = re.compile(r'\\href\{[^}]*\}\{([^}]*)\}')
+COMMAND_PATTERN = re.compile(r'\\url\{[^}]*\}|\\[a-zA-Z]+\s*')
+BRACE_TRANSLATION = str.maketrans('', '', '{}')
+COMMENT_PATTERN = re.compile(r'%.*$', re.MULTILINE)
+
+
+@lru_cache(maxsize=64)
+def _section_header_pattern(section_names: Tuple[str, ...]) -> re.Pattern:
+    r"""
+    Compile one pattern matching a header for any of the section names.
+    
+    Matches \section{Name} or \section*{Name}, \section{\textbf{Name}} and
+    \resumeSection{Name}. Group 1 is set for the \textbf form, which needs
+    its second closing brace, group 2 for \resumeSection, and group 3 is
+    the name.
+    """
+    names = '|'.join(re.escape(name) for name in section_names)
+    return re.compile(
+        rf'(?:\\section\*?\s*\{{\s*(\\textbf\{{\s*)?|(\\resumeSection)\s*\{{\s*)({names})\s*\}}(?(1)\s*\}})',
+        re.IGNORECASE
+    )
+
 
 def read_latex_file(file_path: str) -> str:
     """Read LaTeX file as text."""
@@ -25,21 +77,27 @@ def extract_braced_content(text: str, start_pos: int) -> Tuple[str, int]:
     if start_pos >= len(text) or text[start_pos] != '{':
         return '', start_pos
     
-    depth = 0
+    depth = 1
     content_start = start_pos + 1
-    pos = start_pos
-    
-    while pos < len(text):
-        if text[pos] == '{':
+    next_open = text.find('{', content_start)
+    pos = content_start
+    
+    # Jump between braces instead of stepping through every character
+    while True:
+        next_close = text.find('}', pos)
+        if next_close == -1:
+            # No closing brace found
+            return text[content_start:], len(text)
+        
+        # Count opening braces that come before this closing brace
+        while next_open != -1 and next_open < next_close:
             depth += 1
-        elif text[pos] == '}':
-            depth -= 1
-            if depth == 0:
-                return text[content_start:pos], pos + 1
-        pos += 1
-    
-    # No closing brace found
-    return text[content_start:], len(text)
+            next_open = text.find('{', next_open + 1)
+        
+        depth -= 1
+        if depth == 0:
+            return text[content_start:next_close], next_close + 1
+        pos = next_close + 1
 
 
 def find_section(content: str, section_names: List[str]) -> Optional[str]:
@@ -48,29 +106,53 @@ def find_section(content: str, section_names: List[str]) -> Optional[str]:
     Returns the content between the section start and next section (or end of file).
     Handles various section command formats.
     """
-    for section_name in section_names:
-        # Try different patterns for section commands
-        patterns = [
-            rf'\\section\*?\s*\{{\s*{re.escape(section_name)}\s*\}}',  # \section{Name} or \section*{Name}
-            rf'\\section\*?\s*\{{\s*\\textbf\{{\s*{re.escape(section_name)}\s*\}}\s*\}}',  # \section{\textbf{Name}}
-            rf'\\resumeSection\s*\{{\s*{re.escape(section_name)}\s*\}}',  # Custom \resumeSection
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                start_pos = match.end()
-                # Find next section or end of document
-                next_section = re.search(r'\\(?:section|resumeSection)\*?\s*\{', content[start_pos:], re.IGNORECASE)
-                if next_section:
-                    return content[start_pos:start_pos + next_section.start()].strip()
-                else:
-                    # Check for \end{document}
-                    end_doc = re.search(r'\\end\{document\}', content[start_pos:])
-                    if end_doc:
-                        return content[start_pos:start_pos + end_doc.start()].strip()
-                    return content[start_pos:].strip()
-    return None
+    if not section_names:
+        return None
+    
+    # One scan finds every header. Earlier names win over position, then
+    # \section{Name} over \section{\textbf{Name}} over \resumeSection{Name}
+    priorities = {name.lower(): i * 3 for i, name in reversed(list(enumerate(section_names)))}
+    best_priority, best_match = len(section_names) * 3, None
+    for match in _section_header_pattern(tuple(section_names)).finditer(content):
+        priority = priorities[match.group(3).lower()] + (1 if match.group(1) else 2 if match.group(2) else 0)
+        if priority < best_priority:
+            best_priority, best_match = priority, match
+            if priority == 0:
+                break
+    
+    if best_match is None:
+        return None
+    
+    start_pos = best_match.end()
+    # Find next section or end of document
+    next_section = NEXT_SECTION_PATTERN.search(content, start_pos)
+    if next_section:
+        return content[start_pos:next_section.start()].strip()
+    # Check for \end{document}
+    end_doc = END_DOCUMENT_PATTERN.search(content, start_pos)
+    if end_doc:
+        return content[start_pos:end_doc.start()].strip()
+    return content[start_pos:].strip()
+
+
+def _extract_arguments(content: str, pos: int, count: int) -> Tuple[List[str], int]:
+    """
+    Extract up to count braced arguments starting at pos, skipping whitespace
+    between them. Missing arguments are returned as ''.
+    
+    Returns (args, end_pos) where end_pos is the position after the last argument read.
+    """
+    args = []
+    for _ in range(count):
+        # Skip whitespace to find next brace
+        while pos < len(content) and content[pos] in ' \t\n\r':
+            pos += 1
+        if pos < len(content) and content[pos] == '{':
+            arg, pos = extract_braced_content(content, pos)
+            args.append(arg.strip())
+        else:
+            args.append('')
+    return args, pos
 
 
 def extract_experiences(content: str) -> Dict[str, Dict]:
@@ -87,130 +169,89 @@ def extract_experiences(content: str) -> Dict[str, Dict]:
     experiences = {}
     exp_idx = 0
     
-    # Pattern 1: \resumeSubheading with 4 arguments (most common)
-    # Handle nested braces by finding command and then extracting each argument
-    subheading_starts = list(re.finditer(r'\\resumeSubheading\s*\{', content))
-    
-    for match in subheading_starts:
-        pos = match.end() - 1  # Position at the opening brace
+    # One scan finds every heading and list end. Subheading bullets run to
+    # the next heading or \resumeSubHeadingListEnd; project bullets also stop
+    # at \resumeItemListEnd.
+    boundaries = list(HEADING_BOUNDARY_PATTERN.finditer(content))
+    subheading_ends = [match.start() for match in boundaries if not match.group(2)]
+    project_ends = [match.start() for match in boundaries]
+    
+    for match in boundaries:
+        command = match.group(1)
+        if not command:
+            continue
         
-        # Extract 4 arguments
-        args = []
-        for _ in range(4):
-            if pos < len(content) and content[pos] == '{':
-                arg, pos = extract_braced_content(content, pos)
-                args.append(arg.strip())
-            else:
-                # Skip whitespace to find next brace
-                while pos < len(content) and content[pos] in ' \t\n\r':
-                    pos += 1
-                if pos < len(content) and content[pos] == '{':
-                    arg, pos = extract_braced_content(content, pos)
-                    args.append(arg.strip())
-                else:
-                    args.append('')
+        if command == 'resumeSubheading':
+            # \resumeSubheading with 4 arguments (most common)
+            args, pos = _extract_arguments(content, match.end() - 1, 4)
+            ends = subheading_ends
+        else:
+            # \resumeProjectHeading with 2 arguments
+            args, pos = _extract_arguments(content, match.end() - 1, 2)
+            if not args[0]:
+                continue
+            ends = project_ends
         
-        if len(args) >= 2:
-            exp_idx += 1
-            role = args[0] if len(args) > 0 else ''
-            company = args[1] if len(args) > 1 else ''
-            date = args[2] if len(args) > 2 else ''
-            location = args[3] if len(args) > 3 else ''
-            
-            # Find bullets for this experience
-            # Start from current position
-            start_pos = pos
-            
-            # Find end of this experience (next subheading or end of section)
-            next_subheading = re.search(r'\\resumeSubheading\s*\{|\\resumeProjectHeading\s*\{|\\resumeSubHeadingListEnd', content[start_pos:])
-            if next_subheading:
-                end_pos = start_pos + next_subheading.start()
-            else:
-                end_pos = len(content)
-            
-            experience_content = content[start_pos:end_pos]
-            bullets = extract_bullets(experience_content)
-            
-            experiences[f"experience_{exp_idx}"] = {
-                "role": clean_latex_text(role),
-                "company": clean_latex_text(company),
-                "date": clean_latex_text(date),
-                "location": clean_latex_text(location),
-                "bullets": bullets
-            }
-    
-    # Pattern 2: \resumeProjectHeading with 2 arguments
-    project_starts = list(re.finditer(r'\\resumeProjectHeading\s*\{', content))
-    
-    for match in project_starts:
-        pos = match.end() - 1
+        # Find bullets between the arguments and the next boundary
+        next_end = bisect_left(ends, pos)
+        end_pos = ends[next_end] if next_end < len(ends) else len(content)
+        bullets = extract_bullets(content[pos:end_pos])
         
-        args = []
-        for _ in range(2):
-            if pos < len(content) and content[pos] == '{':
-                arg, pos = extract_braced_content(content, pos)
-                args.append(arg.strip())
-            else:
-                while pos < len(content) and content[pos] in ' \t\n\r':
-                    pos += 1
-                if pos < len(content) and content[pos] == '{':
-                    arg, pos = extract_braced_content(content, pos)
-                    args.append(arg.strip())
-                else:
-                    args.append('')
+        exp_idx += 1
+        if command == 'resumeSubheading':
+            role, company, date, location = args
+        else:
+            role, date = args
+            company = location = ''
         
-        if len(args) >= 1 and args[0]:
-            exp_idx += 1
-            
-            start_pos = pos
-            next_heading = re.search(r'\\resumeSubheading\s*\{|\\resumeProjectHeading\s*\{|\\resumeSubHeadingListEnd|\\resumeItemListEnd', content[start_pos:])
-            if next_heading:
-                end_pos = start_pos + next_heading.start()
-            else:
-                end_pos = len(content)
-            
-            experience_content = content[start_pos:end_pos]
-            bullets = extract_bullets(experience_content)
-            
-            experiences[f"experience_{exp_idx}"] = {
-                "role": clean_latex_text(args[0]),
-                "company": "",
-                "date": clean_latex_text(args[1]) if len(args) > 1 else "",
-                "location": "",
-                "bullets": bullets
-            }
+        experiences[f"experience_{exp_idx}"] = {
+            "role": clean_latex_text(role),
+            "company": clean_latex_text(company),
+            "date": clean_latex_text(date),
+            "location": clean_latex_text(location),
+            "bullets": bullets
+        }
     
     return experiences
 
 
+def _split_items(content: str) -> List[str]:
+    r"""
+    Split content into the text of each \item, up to the next \item,
+    \end{ or \resumeItemListEnd (or the end of the content).
+    
+    Uses plain string splitting and find, so it runs in linear time on any input.
+    """
+    items = []
+    for part in content.split(ITEM_COMMAND)[1:]:  # Skip text before the first \item
+        end = len(part)
+        for marker in ITEM_LIST_END_MARKERS:
+            idx = part.find(marker, 0, end)
+            if idx != -1:
+                end = idx
+        items.append(part[:end])
+    return items
+
+
 def extract_bullets(content: str) -> List[str]:
     r"""
     Extract bullet points from LaTeX content.
     Handles \resumeItem{...} and \item ...
     """
-    bullets = []
-    
     # Extract from \resumeItem{...} - handle nested braces
-    resume_item_starts = list(re.finditer(r'\\resumeItem\s*\{', content))
-    
-    for match in resume_item_starts:
-        pos = match.end() - 1  # Position at opening brace
-        bullet_text, _ = extract_braced_content(content, pos)
-        cleaned = clean_latex_text(bullet_text)
-        if cleaned:
-            bullets.append(cleaned)
+    # (match.end() - 1 is the position of the opening brace)
+    cleaned = (
+        clean_latex_text(extract_braced_content(content, match.end() - 1)[0])
+        for match in RESUME_ITEM_PATTERN.finditer(content)
+    )
+    bullets = [bullet for bullet in cleaned if bullet]
     
     # If no \resumeItem found, try \item
     if not bullets:
         # Match \item followed by text until next \item, \end, or end of string
         # Handle multi-line items
-        item_pattern = r'\\item\s*(.*?)(?=\\item|\\end\{|\\resumeItemListEnd|$)'
-        items = re.findall(item_pattern, content, re.DOTALL)
-        
-        for item in items:
-            cleaned = clean_latex_text(item)
-            if cleaned:
-                bullets.append(cleaned)
+        cleaned = (clean_latex_text(item) for item in _split_items(content))
+        bullets = [bullet for bullet in cleaned if bullet]
     
     return bullets
 
@@ -225,33 +266,38 @@ def clean_latex_text(text: str) -> str:
     
     # Remove common LaTeX commands while keeping their content
     # \textbf{text} -> text
-    text = re.sub(r'\\textbf\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\textit\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\emph\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\underline\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\textsc\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\textsf\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\texttt\{([^}]*)\}', r'\1', text)
+    text = TEXT_FORMAT_PATTERN.sub(r'\1', text)
     
     # Remove \href{url}{text} -> text
-    text = re.sub(r'\\href\{[^}]*\}\{([^}]*)\}', r'\1', text)
+    text = HREF_PATTERN.sub(r'\1', text)
     
-    # Remove \url{...}
-    text = re.sub(r'\\url\{[^}]*\}', '', text)
-    
-    # Remove common single commands
-    text = re.sub(r'\\[a-zA-Z]+\s*', '', text)
+    # Remove \url{...} and common single commands
+    text = COMMAND_PATTERN.sub('', text)
     
     # Remove remaining braces
-    text = re.sub(r'[{}]', '', text)
+    text = text.translate(BRACE_TRANSLATION)
     
     # Remove comments
-    text = re.sub(r'%.*$', '', text, flags=re.MULTILINE)
+    text = COMMENT_PATTERN.sub('', text)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    return ' '.join(text.split())
+
+
+def _clean_skill_list(skills_text: str) -> List[str]:
+    """Clean each comma-separated skill, dropping empty and overlong entries."""
+    cleaned = (clean_latex_text(skill) for skill in skills_text.split(','))
+    return [skill for skill in cleaned if skill and len(skill) < 50]  # Reasonable skill length
+
+
+def _split_skills(item_text: str) -> List[str]:
+    """
+    Split one skills item into skills. For the category format
+    (e.g., "Languages: Python, Java, C++") only the part after the colon is used.
+    """
+    if ':' in item_text:
+        item_text = item_text.split(':', 1)[1]
+    return _clean_skill_list(item_text)
 
 
 def extract_skills(content: str) -> List[str]:
@@ -265,73 +311,38 @@ def extract_skills(content: str) -> List[str]:
     - \textbf{Category:} skill1, skill2, skill3
     - Plain text with commas
     """
-    skills = []
-    
     # Extract from \resumeItem{...}
-    resume_item_starts = list(re.finditer(r'\\resumeItem\s*\{', content))
-    
-    for match in resume_item_starts:
-        pos = match.end() - 1
-        item_text, _ = extract_braced_content(content, pos)
-        
-        # Check if it's a category: skills format (e.g., "Languages: Python, Java, C++")
-        if ':' in item_text:
-            parts = item_text.split(':', 1)
-            if len(parts) == 2:
-                # Extract skills after the colon
-                skills_text = parts[1]
-                for skill in skills_text.split(','):
-                    cleaned = clean_latex_text(skill)
-                    if cleaned and len(cleaned) < 50:  # Reasonable skill length
-                        skills.append(cleaned)
-        else:
-            # Single skill or comma-separated
-            for skill in item_text.split(','):
-                cleaned = clean_latex_text(skill)
-                if cleaned and len(cleaned) < 50:
-                    skills.append(cleaned)
+    skills = [
+        skill
+        for match in RESUME_ITEM_PATTERN.finditer(content)
+        for skill in _split_skills(extract_braced_content(content, match.end() - 1)[0])
+    ]
     
     # Try \item format if no skills found
     if not skills:
-        item_pattern = r'\\item\s*(.*?)(?=\\item|\\end\{|\\resumeItemListEnd|$)'
-        items = re.findall(item_pattern, content, re.DOTALL)
-        
-        for item in items:
-            # Check for category format
-            if ':' in item:
-                parts = item.split(':', 1)
-                if len(parts) == 2:
-                    for skill in parts[1].split(','):
-                        cleaned = clean_latex_text(skill)
-                        if cleaned and len(cleaned) < 50:
-                            skills.append(cleaned)
-            else:
-                for skill in item.split(','):
-                    cleaned = clean_latex_text(skill)
-                    if cleaned and len(cleaned) < 50:
-                        skills.append(cleaned)
+        skills = [skill for item in _split_items(content) for skill in _split_skills(item)]
     
     # Try to extract from plain text patterns like "Skills: X, Y, Z"
     if not skills:
         # Look for patterns like \textbf{Category:} X, Y, Z
-        pattern = r'\\textbf\{([^}]+)\}\s*:?\s*([^\\]+)'
-        matches = re.findall(pattern, content)
-        for category, skills_text in matches:
-            for skill in skills_text.split(','):
-                cleaned = clean_latex_text(skill)
-                if cleaned and len(cleaned) < 50:
-                    skills.append(cleaned)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_skills = []
+        skills = [
+            skill
+            for _, skills_text in BOLD_CATEGORY_PATTERN.findall(content)
+            for skill in _clean_skill_list(skills_text)
+        ]
+    
+    # Remove duplicates while preserving order (dicts keep insertion order,
+    # so the first spelling of each skill wins)
+    unique_skills = {}
     for skill in skills:
-        skill_lower = skill.lower().strip()
-        if skill_lower and skill_lower not in seen:
-            seen.add(skill_lower)
-            unique_skills.append(skill.strip())
+        skill = skill.strip()
+        if skill:
+            unique_skills.setdefault(skill.lower(), skill)
     
-    return unique_skills
+    return list(unique_skills.values())
+
+
+_extraction_cache = LRUCache(EXTRACTION_CACHE_SIZE)
 
 
 def extract_from_latex(file_path: str) -> Dict:
@@ -353,7 +364,16 @@ def extract_from_latex(file_path: str) -> Dict:
         },
         "skills": ["SQL", "Python", "Power BI"]
     }
+    
+    Results are cached by path, modification time and size, so an
+    unchanged file is not parsed again.
     """
+    stat = os.stat(file_path)
+    cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+    cached = _extraction_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     content = read_latex_file(file_path)
     
     # Debug: Print first 500 chars to understand the format
@@ -375,7 +395,7 @@ def extract_from_latex(file_path: str) -> Dict:
     # If no section found, try to extract from entire document
     if not experience_section:
         # Check if there are resumeSubheading commands anywhere
-        if re.search(r'\\resumeSubheading\s*\{', content):
+        if SUBHEADING_PATTERN.search(content):
             experience_section = content
     
     if not experience_section:
@@ -399,9 +419,9 @@ def extract_from_latex(file_path: str) -> Dict:
     # If no section found, try to extract from entire document
     if not skills_section:
         # Check for resumeItem or item commands with skills-like content
-        if re.search(r'\\resumeItem\s*\{', content) or re.search(r'\\item', content):
+        if RESUME_ITEM_PATTERN.search(content) or ITEM_COMMAND in content:
             # Try to find a skills-related block
-            skills_block_match = re.search(r'(Languages|Tools|Frameworks|Technologies)\s*:', content, re.IGNORECASE)
+            skills_block_match = SKILLS_BLOCK_PATTERN.search(content)
             if skills_block_match:
                 # Extract surrounding content
                 start = max(0, skills_block_match.start() - 100)
@@ -413,15 +433,19 @@ def extract_from_latex(file_path: str) -> Dict:
     else:
         skills = extract_skills(skills_section)
     
-    return {
+    result = {
         "experiences": experiences,
         "skills": skills
     }
+    _extraction_cache.put(cache_key, result)
+    return result
 
 
 def extract_from_latex_string(content: str) -> Dict:
     """
     Extract from LaTeX content string directly (for testing/debugging).
+    
+    Not cached here: the app caches string extraction itself.
     """
     experience_section_names = [
         "Professional Experience",
@@ -433,7 +457,7 @@ def extract_from_latex_string(content: str) -> Dict:
     experience_section = find_section(content, experience_section_names)
     
     if not experience_section:
-        if re.search(r'\\resumeSubheading\s*\{', content):
+        if SUBHEADING_PATTERN.search(content):
             experience_section = content
     
     experiences = extract_experiences(experience_section) if experience_section else {}
@@ -5,13 +5,120 @@ Uses GPT to extract structured information from job descriptions.
 Fetches job descriptions from URLs or processes raw text.
 """
 
-import os
+import copy
 import json
-from openai import OpenAI
-from typing import Dict, Optional
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Optional: orjson for faster response decoding (raises a json.JSONDecodeError subclass)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional: tiktoken to truncate job descriptions by real token count
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 # Import the hybrid fetcher module
 from utils.jd_fetcher import fetch_job_description as fetch_jd
+from utils.jd_fetcher import take_prefetched_job_description
+
+# Shared analysis cache and OpenAI client helpers
+from utils._cache import LRUCache
+from utils._openai_client import get_openai_client
+
+
+# Model used for job description analysis
+JD_ANALYSIS_MODEL = "gpt-4o-mini"
+
+# Job description budget sent to GPT; the character limit (~4 chars per
+# token) is used when tiktoken or its encoding is unavailable
+JD_MAX_TOKENS = 3000
+JD_MAX_CHARS = 12000
+
+
+def _string_array(description: str) -> Dict:
+    """JSON schema for an array of strings."""
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+
+# Structured output schema for the analysis; the field descriptions replace
+# the field list that used to be spelled out in the prompt
+JD_ANALYSIS_SCHEMA = {
+    "name": "jd_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "responsibilities": _string_array("Key job responsibilities, at least 3-5 if present"),
+            "required_skills": _string_array("Required technical and soft skills"),
+            "tools_technologies": _string_array("Tools, technologies, software and platforms"),
+            "ats_keywords": _string_array("ATS keywords: job-specific terms, acronyms, certifications"),
+            "seniority_level": {
+                "type": "string",
+                "enum": ["junior", "mid-level", "senior", "executive", ""],
+                "description": "Seniority based on experience requirements",
+            },
+        },
+        "required": ["responsibilities", "required_skills", "tools_technologies", "ats_keywords", "seniority_level"],
+        "additionalProperties": False,
+    },
+}
+
+# Analyses reused for repeat job description text
+ANALYSIS_CACHE_SIZE = 256
+
+# Maximum number of job descriptions analyzed concurrently by extract_and_analyze_jds()
+MAX_CONCURRENT_ANALYSES = 8
+
+_analysis_cache = LRUCache(ANALYSIS_CACHE_SIZE)
+
+
+def _analysis_cache_key(jd_text: str) -> str:
+    """Key an analysis by a hash of the job description text and the model."""
+    digest = hashlib.sha256(jd_text.strip().encode('utf-8', 'surrogatepass')).hexdigest()
+    return f"{digest}:{JD_ANALYSIS_MODEL}"
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the analysis model's tokenizer once, or return None if unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(JD_ANALYSIS_MODEL)
+        except KeyError:
+            # Older tiktoken releases do not know the model name
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # The encoding file is downloaded on first use and may be unreachable
+        return None
+
+
+def _truncate_jd_text(jd_text: str) -> Tuple[str, Optional[str]]:
+    """
+    Limit job description text to the analysis budget.
+    
+    Returns (text, note) where note describes the truncation, or None if the
+    text was kept whole.
+    """
+    # Every token covers at least one character, so short text never needs counting
+    encoding = _get_encoding() if len(jd_text) > JD_MAX_TOKENS else None
+    if encoding is not None:
+        tokens = encoding.encode(jd_text, disallowed_special=())
+        if len(tokens) > JD_MAX_TOKENS:
+            return encoding.decode(tokens[:JD_MAX_TOKENS]), f"Truncated content to {JD_MAX_TOKENS} tokens"
+        return jd_text, None
+    
+    if len(jd_text) > JD_MAX_CHARS:
+        return jd_text[:JD_MAX_CHARS], f"Truncated content to {JD_MAX_CHARS} chars"
+    return jd_text, None
 
 
 def extract_and_analyze_jd(
@@ -52,8 +159,10 @@ def extract_and_analyze_jd(
     
     # Get job description text
     if job_url:
-        # Use the fetcher with specified mode
-        fetch_result = fetch_jd(job_url, mode=fetch_mode)
+        # Reuse a background prefetch if one was started, else fetch now
+        fetch_result = take_prefetched_job_description(job_url, fetch_mode)
+        if fetch_result is None:
+            fetch_result = fetch_jd(job_url, mode=fetch_mode)
         jd_text = fetch_result.get("raw_text", "")
         
         # Build debug info from fetch result
@@ -82,65 +191,49 @@ def extract_and_analyze_jd(
             "_raw_content": jd_text[:500] if jd_text else "No content"
         }
     
-    # Limit content to avoid token limits (approximately 12000 chars ~ 3000 tokens)
-    if len(jd_text) > 12000:
-        jd_text = jd_text[:12000]
-        debug_info += f"\nTruncated content to 12000 chars"
+    # Limit content to avoid token limits
+    jd_text, truncation_note = _truncate_jd_text(jd_text)
+    if truncation_note:
+        debug_info += f"\n{truncation_note}"
     
-    # Get API key from environment
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable is not set")
+    # Reuse the analysis of identical text instead of calling GPT again
+    cache_key = _analysis_cache_key(jd_text)
+    cached = _analysis_cache.get(cache_key)
+    if cached is not None:
+        cached["_debug"] = debug_info + "\nReused cached analysis (no GPT call)"
+        return cached
     
-    # Initialize OpenAI client
-    client = OpenAI(api_key=api_key)
+    # Shared OpenAI client (raises if OPENAI_API_KEY is not set)
+    client = get_openai_client()
     
     # Create prompt for GPT
+    # The response schema describes the fields, so the prompt only carries the text
     prompt = f"""Analyze the following job description and extract structured information.
 
 Job Description:
-{jd_text}
-
-Extract and return a JSON object with these fields:
-- "responsibilities": array of key job responsibilities (at least 3-5 items if present)
-- "required_skills": array of required skills mentioned (technical and soft skills)
-- "tools_technologies": array of tools, technologies, software, and platforms mentioned
-- "ats_keywords": array of important keywords for ATS systems (job-specific terms, acronyms, certifications)
-- "seniority_level": one of "junior", "mid-level", "senior", or "executive" based on experience requirements
-
-If certain information is not clearly stated, make reasonable inferences based on the job title and description.
-Return ONLY the JSON object."""
+{jd_text}"""
     
     try:
         # Call GPT API
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=JD_ANALYSIS_MODEL,
             messages=[
                 {
                     "role": "system", 
-                    "content": "You are a job description analyzer expert. Extract all relevant information even if it requires inference. Always return valid JSON with non-empty arrays when possible."
+                    "content": "You are a job description analyzer expert. Extract all relevant information, making reasonable inferences from the job title and description when it is not clearly stated. Use non-empty arrays when possible."
                 },
                 {"role": "user", "content": prompt}
             ],
             temperature=0,
-            response_format={"type": "json_object"}
+            response_format={"type": "json_schema", "json_schema": JD_ANALYSIS_SCHEMA}
         )
         
-        # Extract JSON from response
-        content = response.choices[0].message.content.strip()
+        # Structured outputs return bare JSON; content is None on a refusal
+        content = (response.choices[0].message.content or "").strip()
         debug_info += f"\nGPT response received ({len(content)} chars)"
         
-        # Remove markdown code blocks if present
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-        
         # Parse JSON
-        result = json.loads(content)
+        result = json_loads(content)
         
         # Ensure all required fields are present and are lists
         required_fields = ["responsibilities", "required_skills", "tools_technologies", "ats_keywords"]
@@ -157,6 +250,7 @@ Return ONLY the JSON object."""
         result["_debug"] = debug_info
         result["_raw_content_preview"] = jd_text[:500] + "..." if len(jd_text) > 500 else jd_text
         
+        _analysis_cache.put(cache_key, result)
         return result
         
     except json.JSONDecodeError as e:
@@ -171,3 +265,41 @@ Return ONLY the JSON object."""
         }
     except Exception as e:
         raise ValueError(f"Error calling OpenAI API: {str(e)}\n\nDebug info:\n{debug_info}")
+
+
+def extract_and_analyze_jds(
+    job_urls: List[str],
+    fetch_mode: str = "auto",
+    max_workers: int = MAX_CONCURRENT_ANALYSES
+) -> List[Dict]:
+    """
+    Extract and analyze several job descriptions concurrently.
+    
+    Each URL goes through extract_and_analyze_jd() on a thread pool sharing
+    one OpenAI client, so the fetches and GPT calls overlap and the batch
+    takes about as long as its slowest job description.
+    
+    Args:
+        job_urls: Job posting URLs to analyze
+        fetch_mode: URL fetch mode - "auto", "requests", or "playwright"
+        max_workers: Maximum number of concurrent analyses
+        
+    Returns:
+        List of extract_and_analyze_jd() results, in the same order as job_urls
+        
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set or a GPT call fails
+    """
+    if not job_urls:
+        return []
+    
+    # Analyze each distinct URL once
+    unique_urls = list(dict.fromkeys(url.strip() for url in job_urls))
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls)), thread_name_prefix="jd-analyze") as executor:
+        analyses = dict(zip(
+            unique_urls,
+            executor.map(lambda url: extract_and_analyze_jd(job_url=url, fetch_mode=fetch_mode), unique_urls)
+        ))
+    
+    return [copy.deepcopy(analyses[url.strip()]) for url in job_urls]
@@ -6,17 +6,221 @@ GPT outputs plain text only - no LaTeX syntax.
 """
 
 import os
+import re
 import json
-from openai import OpenAI
-from typing import List, Dict
+import time
+import random
+import hashlib
+import threading
+from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from openai import OpenAI, APIConnectionError, InternalServerError, RateLimitError
+from typing import Dict, Iterator, List, Optional, Tuple, TypedDict
 
+# Optional: orjson for faster response decoding (raises a json.JSONDecodeError subclass)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-def rewrite_bullets(bullets: List[str], jd_analysis: Dict) -> List[Dict]:
+# Shared response cache and OpenAI client helpers
+from utils._cache import LRUCache
+from utils._openai_client import get_openai_client
+
+
+# Bullets rewritten per GPT request; longer resumes are split into groups
+REWRITE_BATCH_SIZE = 12
+
+# Maximum number of GPT requests in flight for one rewrite
+LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', '4'))
+
+# Keywords from the job description analysis included in rewrite prompts
+JD_CONTEXT_MAX_KEYWORDS = 30
+
+# Maximum number of GPT requests in flight across the whole process
+LLM_INFLIGHT_LIMIT = int(os.getenv('LLM_INFLIGHT_LIMIT', '8'))
+
+# Attempts per GPT request on rate limits, connection errors and 5xx
+# responses, with exponential backoff between them (in seconds)
+LLM_MAX_ATTEMPTS = 5
+LLM_RETRY_MIN_DELAY = 1.0
+LLM_RETRY_MAX_DELAY = 30.0
+
+# OpenAI Batch API turnaround, and the statuses after which a batch will not change
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Model and OpenAI service tier for suggest_skills_llm(). Flex processing
+# (about half price, slower) suits this background pass but is only offered
+# for some models, e.g. SKILLS_MODEL=o4-mini with SKILLS_SERVICE_TIER=flex;
+# for any other model the flex setting is ignored
+SKILLS_MODEL = os.getenv('SKILLS_MODEL', 'gpt-4o-mini')
+SKILLS_SERVICE_TIER = os.getenv('SKILLS_SERVICE_TIER', '')
+FLEX_TIER_MODEL_PREFIXES = ("o3", "o4-mini", "gpt-5")
+
+# Characters dropped when comparing skill names ("C++", "C#" and "Node.js" keep theirs)
+SKILL_NOISE_PATTERN = re.compile(r'[^a-z0-9+#.]')
+
+# Similarity (0-1) above which two different skill names may be the same skill.
+# Keys of SKILL_CONTAINMENT_MIN_LENGTH+ characters also match inside a longer
+# name ("SQL" and "PostgreSQL")
+SKILL_MATCH_CUTOFF = 0.8
+SKILL_CONTAINMENT_MIN_LENGTH = 3
+
+# Common abbreviations and spellings, as normalized keys, mapped to one normalized skill
+SKILL_ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+    "nodejs": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "ml": "machinelearning",
+    "dl": "deeplearning",
+    "ai": "artificialintelligence",
+    "nlp": "naturallanguageprocessing",
+    "aws": "amazonwebservices",
+    "gcp": "googlecloudplatform",
+    "msexcel": "excel",
+    "microsoftexcel": "excel",
+    "microsoftpowerbi": "powerbi",
+}
+
+# Parsed GPT responses reused for repeat requests
+RESPONSE_CACHE_SIZE = 256
+
+# Fixed parts of every bullet rewrite prompt. They come before the per-request
+# job context and bullets so OpenAI's prompt caching can reuse the prefix
+BULLET_REWRITE_SYSTEM_PROMPT = (
+    "You are a resume optimization expert. Return a JSON object whose \"items\" array "
+    "holds the rewritten bullets in the same order as the input. Do not hallucinate "
+    "tools or technologies."
+)
+
+BULLET_REWRITE_INSTRUCTIONS = """You are a resume optimization expert. Rewrite each bullet point to be more ATS-friendly and aligned with the job description, while maintaining accuracy and truthfulness.
+
+Instructions:
+- Rewrite each bullet to incorporate relevant ATS keywords naturally
+- Use action verbs and quantifiable metrics where possible
+- Maintain the original meaning and accuracy
+- Do NOT add tools, technologies, or skills that weren't in the original
+- Output ONLY plain text - no LaTeX, no markdown, no special formatting
+- Keep bullets concise and impactful
+
+Return a JSON object {"items": [...]} where "items" holds one rewritten bullet string per original bullet, in the same order as the original bullets."""
+
+# Start of the "items" array in a (possibly partial) bullet rewrite response
+ITEMS_ARRAY_PATTERN = re.compile(r'"items"\s*:\s*\[')
+
+# Opening ```json / ``` and closing ``` fences around a GPT JSON response
+MARKDOWN_FENCE_PATTERN = re.compile(r'\A\s*```(?:json)?\s*|\s*```\s*\Z')
+
+
+class BulletRewrite(TypedDict):
+    """One rewritten bullet. A plain dict at runtime, so it stays JSON-serializable and editable."""
+    original: str
+    suggested: str
+
+
+_llm_slots = threading.BoundedSemaphore(LLM_INFLIGHT_LIMIT)
+
+_response_cache = LRUCache(RESPONSE_CACHE_SIZE)
+
+
+def _get_client() -> OpenAI:
+    """
+    Return the shared OpenAI client with the SDK's own retries turned off.
+    
+    _chat_completion() retries instead, outside the in-flight slot.
+    
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    return get_openai_client(max_retries=0)
+
+
+@contextmanager
+def _chat_completion(client: OpenAI, request: Dict):
+    """
+    Call chat.completions.create(), retrying transient failures.
+    
+    Holds one of LLM_INFLIGHT_LIMIT slots from the request until the
+    with-block exits (not while backing off), so concurrent rewrites cannot
+    pile onto the rate limit. A streamed response is still in flight after
+    create() returns, so read it inside the block. Rate limits, connection
+    errors and server errors are retried up to LLM_MAX_ATTEMPTS times;
+    anything else is raised immediately.
+    """
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        _llm_slots.acquire()
+        try:
+            response = client.chat.completions.create(**request)
+            break
+        except (RateLimitError, APIConnectionError, InternalServerError):
+            _llm_slots.release()
+            if attempt == LLM_MAX_ATTEMPTS - 1:
+                raise
+        except BaseException:
+            _llm_slots.release()
+            raise
+        
+        delay = min(LLM_RETRY_MAX_DELAY, LLM_RETRY_MIN_DELAY * 2 ** attempt)
+        time.sleep(delay * random.uniform(0.5, 1.0))
+    
+    try:
+        yield response
+    finally:
+        _llm_slots.release()
+
+
+def _chat_create(client: OpenAI, request: Dict):
+    """Call chat.completions.create() for a complete (non-streamed) response; see _chat_completion()."""
+    with _chat_completion(client, request) as response:
+        return response
+
+
+def _response_cache_key(request: Dict) -> str:
+    """Key a response by a hash of the full request (model, messages, temperature, ...)."""
+    payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _format_jd_context(jd_analysis: Dict) -> str:
+    """
+    Format the job description analysis as prompt context.
+    
+    Required skills, tools and ATS keywords overlap heavily, so they are
+    merged into one case-insensitively deduplicated list (in that priority
+    order) capped at JD_CONTEXT_MAX_KEYWORDS.
+    """
+    keywords = {}
+    for field in ('required_skills', 'tools_technologies', 'ats_keywords'):
+        for keyword in jd_analysis.get(field, []):
+            keyword = keyword.strip()
+            if keyword:
+                keywords.setdefault(keyword.lower(), keyword)
+    
+    return f"""Job Description Analysis:
+- Keywords to Target: {', '.join(list(keywords.values())[:JD_CONTEXT_MAX_KEYWORDS])}
+- Seniority Level: {jd_analysis.get('seniority_level', '')}
+- Key Responsibilities: {', '.join(jd_analysis.get('responsibilities', [])[:5])}"""
+
+
+def rewrite_bullets(bullets: List[str], jd_analysis: Dict) -> List[BulletRewrite]:
     """
     Rewrite resume bullets for ATS optimization using GPT.
     
     GPT rewrites each bullet to better match the job description while
-    maintaining accuracy. Outputs plain text only - no LaTeX.
+    maintaining accuracy. Outputs plain text only - no LaTeX. This is the
+    single-list form of rewrite_bullets_batched(), so both share one prompt
+    and one request per group of bullets.
     
     Args:
         bullets: List of original bullet points (plain text)
@@ -32,133 +236,474 @@ def rewrite_bullets(bullets: List[str], jd_analysis: Dict) -> List[Dict]:
         ]
         
     Raises:
-        ValueError: If OPENAI_API_KEY is not set
+        ValueError: If OPENAI_API_KEY is not set or the GPT call fails
     """
-    # Get API key from environment
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable is not set")
-    
-    # Initialize OpenAI client
-    client = OpenAI(api_key=api_key)
-    
-    # Prepare job description context
-    jd_context = f"""Job Description Analysis:
-- Required Skills: {', '.join(jd_analysis.get('required_skills', []))}
-- Tools/Technologies: {', '.join(jd_analysis.get('tools_technologies', []))}
-- ATS Keywords: {', '.join(jd_analysis.get('ats_keywords', []))}
-- Seniority Level: {jd_analysis.get('seniority_level', '')}
-- Key Responsibilities: {', '.join(jd_analysis.get('responsibilities', [])[:5])}"""
-    
-    # Create prompt for GPT
-    prompt = f"""You are a resume optimization expert. Rewrite each bullet point to be more ATS-friendly and aligned with the job description, while maintaining accuracy and truthfulness.
+    rewritten = rewrite_bullets_batched(
+        [("", idx, bullet) for idx, bullet in enumerate(bullets)],
+        jd_analysis
+    )
+    return rewritten.get("", [])
+
+
+def _bullet_rewrite_request(jd_context: str, bullets: List[str]) -> Dict:
+    """Build the chat.completions.create() arguments to rewrite one group of bullets."""
+    numbered = "\n".join([f"{i}. {bullet}" for i, bullet in enumerate(bullets, 1)])
+
+    # Stable text first and the bullets last, so requests share a cacheable prefix
+    prompt = f"""{BULLET_REWRITE_INSTRUCTIONS}
 
 {jd_context}
 
-Original Bullets:
-{chr(10).join(f"{i+1}. {bullet}" for i, bullet in enumerate(bullets))}
+Original Bullets ({len(bullets)}):
+{numbered}"""
 
-Instructions:
-- Rewrite each bullet to incorporate relevant ATS keywords naturally
-- Use action verbs and quantifiable metrics where possible
-- Maintain the original meaning and accuracy
-- Do NOT add tools, technologies, or skills that weren't in the original
-- Output ONLY plain text - no LaTeX, no markdown, no special formatting
-- Keep bullets concise and impactful
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": BULLET_REWRITE_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0,
+        "response_format": {"type": "json_object"}
+    }
 
-Return a JSON array with this exact structure:
-[
-    {{
-        "original": "original bullet text",
-        "suggested": "rewritten bullet text"
-    }}
-]
 
-Return only the JSON array, no markdown code blocks, no explanations."""
-    
+def _parse_bullet_array(content: str) -> Optional[List]:
+    """
+    Parse a bullet rewrite response into its list of items.
+
+    Items may be strings or dicts, and the list may be shorter or longer
+    than the group that was sent.
+
+    Returns:
+        The items, or None if the response has no "items" list
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    parsed = json_loads(content)
+    items = parsed.get("items") if isinstance(parsed, dict) else None
+
+    return items if isinstance(items, list) else None
+
+
+def _rewrite_bullet_group(client: OpenAI, jd_context: str, bullets: List[str]) -> List:
+    """
+    Rewrite one group of bullets with a single GPT call.
+
+    Identical requests are answered from the response cache. Only
+    responses that cover every bullet are cached, so a short reply is
+    asked for again next time.
+
+    Returns:
+        The parsed response from _parse_bullet_array()
+
+    Raises:
+        ValueError: If the GPT call fails or the response is not valid
+            JSON with an "items" list
+    """
+    request = _bullet_rewrite_request(jd_context, bullets)
+    cache_key = _response_cache_key(request)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Call GPT API
-        # Note: Not using json_object format since we need an array, not an object
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a resume optimization expert. Return only valid JSON arrays. Do not hallucinate tools or technologies."
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0
-        )
-        
+        response = _chat_create(client, request)
+
         # Extract JSON from response
-        content = response.choices[0].message.content.strip()
-        
-        # Remove markdown code blocks if present
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-        
-        # Parse JSON - should be an array
-        parsed = json.loads(content)
-        
-        # Handle response format
-        if isinstance(parsed, list):
-            result = parsed
-        elif isinstance(parsed, dict):
-            # If GPT wrapped it in an object, extract the array
-            for value in parsed.values():
-                if isinstance(value, list):
-                    result = value
-                    break
-            else:
-                result = []
-        else:
-            result = []
-        
-        # Validate and ensure structure
-        validated_result = []
-        for i, item in enumerate(result):
-            if isinstance(item, dict):
-                original = item.get('original', bullets[i] if i < len(bullets) else '')
-                suggested = item.get('suggested', original)
-                validated_result.append({
-                    "original": original,
-                    "suggested": suggested
-                })
-            elif isinstance(item, str):
-                # Fallback: if GPT returns just strings, pair with original
-                validated_result.append({
-                    "original": bullets[i] if i < len(bullets) else '',
-                    "suggested": item
-                })
-        
-        # Ensure we have results for all bullets
-        while len(validated_result) < len(bullets):
-            idx = len(validated_result)
-            validated_result.append({
-                "original": bullets[idx],
-                "suggested": bullets[idx]
-            })
-        
-        return validated_result[:len(bullets)]
-        
+        result = _parse_bullet_array(response.choices[0].message.content)
+
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse GPT response as JSON: {str(e)}")
     except Exception as e:
         raise ValueError(f"Error calling OpenAI API: {str(e)}")
 
+    if result is None:
+        raise ValueError('GPT response has no "items" list')
+
+    if len(result) >= len(bullets):
+        _response_cache.put(cache_key, result)
+    return result
+
+
+def _group_bullets(all_bullets: List[Tuple[str, int, str]]) -> List[List[str]]:
+    """Split bullet texts into request-sized groups of REWRITE_BATCH_SIZE."""
+    bullets = [bullet for _, _, bullet in all_bullets]
+    return [bullets[i:i + REWRITE_BATCH_SIZE] for i in range(0, len(bullets), REWRITE_BATCH_SIZE)]
+
+
+def _bullet_suggestion(bullet: str, suggested) -> BulletRewrite:
+    """Pair a bullet with one response item, keeping the original if the item is unusable."""
+    if isinstance(suggested, dict):
+        suggested = suggested.get('suggested', bullet)
+    if not isinstance(suggested, str) or not suggested.strip():
+        suggested = bullet
+    return {
+        "original": bullet,
+        "suggested": suggested.strip()
+    }
+
+
+def _scatter_suggestions(
+    all_bullets: List[Tuple[str, int, str]],
+    groups: List[List[str]],
+    results: List[List]
+) -> Dict[str, List[BulletRewrite]]:
+    """
+    Pair each bullet with its rewrite and group the pairs by experience.
+
+    Bullets without a usable rewrite (a short or failed group response)
+    keep their original text.
+    """
+    # Line the responses up with the bullets; short responses pad with None
+    parsed = [
+        item
+        for group, result in zip(groups, results)
+        for item in (result + [None] * len(group))[:len(group)]
+    ]
+
+    # Scatter rewritten bullets back to their experiences by position
+    grouped = {}
+    for (exp_key, idx, bullet), suggested in zip(all_bullets, parsed):
+        grouped.setdefault(exp_key, []).append((idx, _bullet_suggestion(bullet, suggested)))
+
+    return {
+        exp_key: [item for _, item in sorted(items, key=lambda pair: pair[0])]
+        for exp_key, items in grouped.items()
+    }
+
+
+def iter_rewrite_bullets(bullets: List[str], jd_analysis: Dict) -> Iterator[BulletRewrite]:
+    """
+    Rewrite resume bullets with one streamed GPT call, yielding each as it completes.
+    
+    Streaming form of rewrite_bullets() for interactive callers: the first
+    suggestion is available once GPT has written it rather than after the
+    whole response. All bullets are sent in one request, so keep lists to
+    about REWRITE_BATCH_SIZE. Identical requests are answered from the
+    response cache once a complete response has been received.
+    
+    The generator holds one of LLM_INFLIGHT_LIMIT slots and an open HTTP
+    stream until it is exhausted or closed. Callers that may stop early must
+    close it, e.g.:
+    
+        with closing(iter_rewrite_bullets(bullets, jd_analysis)) as suggestions:
+            for suggestion in suggestions:
+                ...
+    
+    Args:
+        bullets: List of original bullet points (plain text)
+        jd_analysis: Job description analysis from extract_and_analyze_jd()
+        
+    Yields:
+        {"original": "...", "suggested": "..."} dicts in bullet order, one
+        per bullet. Bullets missing from the response keep their original
+        text.
+        
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set or the GPT call fails.
+            Suggestions yielded before a failure are still valid.
+    """
+    if not bullets:
+        return
+    
+    client = _get_client()
+    
+    request = _bullet_rewrite_request(_format_jd_context(jd_analysis), bullets)
+    cache_key = _response_cache_key(request)
+    items = _response_cache.get(cache_key)
+    
+    if items is None:
+        items = []
+        decoder = json.JSONDecoder()
+        content = ""
+        pos = None
+        done = False
+        
+        try:
+            # The stream holds its in-flight slot until it has been read or
+            # the generator is closed; either way the connection is closed too
+            with _chat_completion(client, {**request, "stream": True}) as stream, closing(stream):
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    content += chunk.choices[0].delta.content or ""
+                    
+                    if pos is None:
+                        start = ITEMS_ARRAY_PATTERN.search(content)
+                        if not start:
+                            continue
+                        pos = start.end()
+                    
+                    # Decode every item that has been closed so far
+                    while not done:
+                        while pos < len(content) and content[pos] in ' \t\r\n,':
+                            pos += 1
+                        if pos == len(content):
+                            break
+                        if content[pos] == ']':
+                            done = True
+                            break
+                        try:
+                            item, pos = decoder.raw_decode(content, pos)
+                        except json.JSONDecodeError:
+                            # The item is still being written
+                            break
+                        if len(items) < len(bullets):
+                            yield _bullet_suggestion(bullets[len(items)], item)
+                        items.append(item)
+        
+        except Exception as e:
+            raise ValueError(f"Error calling OpenAI API: {str(e)}")
+        
+        # A cut-off or short response is used once but asked for again next time
+        if done and len(items) >= len(bullets):
+            _response_cache.put(cache_key, items)
+    else:
+        for bullet, item in zip(bullets, items):
+            yield _bullet_suggestion(bullet, item)
+    
+    # Bullets the response did not cover keep their original text
+    for bullet in bullets[len(items):]:
+        yield _bullet_suggestion(bullet, None)
+
+
+def rewrite_bullets_batched(
+    all_bullets: List[Tuple[str, int, str]],
+    jd_analysis: Dict
+) -> Dict[str, List[BulletRewrite]]:
+    """
+    Rewrite bullets from all experiences in as few GPT calls as possible.
+
+    Bullets are sent as numbered lists of up to REWRITE_BATCH_SIZE and the
+    rewritten bullets are scattered back to their experience by position.
+    Larger resumes are split into groups that run concurrently (up to
+    LLM_CONCURRENCY at a time), so a failed group only loses its own
+    bullets. Outputs plain text only.
+
+    Args:
+        all_bullets: List of (exp_key, idx, bullet_text) tuples in resume order
+        jd_analysis: Job description analysis from extract_and_analyze_jd()
+
+    Returns:
+        Dictionary keyed by experience key, each value a list of
+        {"original": "...", "suggested": "..."} dicts ordered by idx.
+        Bullets missing from the GPT response, or from a failed group,
+        keep their original text.
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set or every GPT call fails
+    """
+    if not all_bullets:
+        return {}
+
+    client = _get_client()
+
+    jd_context = _format_jd_context(jd_analysis)
+    groups = _group_bullets(all_bullets)
+
+    if len(groups) == 1:
+        results = [_rewrite_bullet_group(client, jd_context, groups[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(LLM_CONCURRENCY, len(groups)), thread_name_prefix="llm-rewrite") as executor:
+            futures = [executor.submit(_rewrite_bullet_group, client, jd_context, group) for group in groups]
+
+        results = []
+        errors = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except ValueError as e:
+                # Keep the original text for this group only
+                results.append([])
+                errors.append(e)
+        if len(errors) == len(groups):
+            raise errors[0]
+
+    return _scatter_suggestions(all_bullets, groups, results)
+
+
+def submit_bullet_rewrite_batch(
+    jobs: Dict[str, List[Tuple[str, int, str]]],
+    jd_analysis: Dict
+) -> str:
+    """
+    Queue bullet rewrites for several resumes on the OpenAI Batch API.
+
+    For non-interactive jobs: batch requests cost half as much and use a
+    separate rate limit, but may take up to BATCH_COMPLETION_WINDOW to
+    finish. Collect the results with fetch_bullet_rewrite_batch().
+
+    Args:
+        jobs: Job ID -> list of (exp_key, idx, bullet_text) tuples, as passed
+            to rewrite_bullets_batched(). Job IDs must not contain ':'.
+        jd_analysis: Job description analysis from extract_and_analyze_jd()
+
+    Returns:
+        The batch ID
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set, there is nothing to
+            rewrite, or the batch cannot be created
+    """
+    client = _get_client()
+
+    # One request per group, identified as "<job_id>:<group_index>"
+    jd_context = _format_jd_context(jd_analysis)
+    lines = [
+        json.dumps({
+            "custom_id": f"{job_id}:{group_index}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _bullet_rewrite_request(jd_context, group)
+        })
+        for job_id, all_bullets in jobs.items()
+        for group_index, group in enumerate(_group_bullets(all_bullets))
+    ]
+    if not lines:
+        raise ValueError("No bullets to rewrite")
+
+    try:
+        input_file = client.files.create(
+            file=("bullet_rewrites.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+    except Exception as e:
+        raise ValueError(f"Error calling OpenAI API: {str(e)}")
+
+    return batch.id
+
+
+def fetch_bullet_rewrite_batch(
+    batch_id: str,
+    jobs: Dict[str, List[Tuple[str, int, str]]]
+) -> Optional[Dict[str, Dict[str, List[BulletRewrite]]]]:
+    """
+    Collect the results of a batch from submit_bullet_rewrite_batch().
+
+    Args:
+        batch_id: ID returned by submit_bullet_rewrite_batch()
+        jobs: The same jobs that were submitted
+
+    Returns:
+        None while the batch is still running. Once it has ended, job ID ->
+        the rewrite_bullets_batched() result for that job. Bullets whose
+        request failed (or was not run before the batch expired or was
+        cancelled) keep their original text.
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set or the OpenAI call fails
+    """
+    client = _get_client()
+
+    try:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status not in BATCH_FINAL_STATUSES:
+            return None
+
+        output = client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+    except Exception as e:
+        raise ValueError(f"Error calling OpenAI API: {str(e)}")
+
+    # Parse each successful response by its custom_id
+    responses = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json_loads(line)
+            body = (record.get("response") or {}).get("body") or {}
+            responses[record["custom_id"]] = _parse_bullet_array(body["choices"][0]["message"]["content"]) or []
+        except (json.JSONDecodeError, KeyError, IndexError, TypeError, AttributeError):
+            # A failed or malformed request keeps its group's original bullets
+            continue
+
+    results = {}
+    for job_id, all_bullets in jobs.items():
+        groups = _group_bullets(all_bullets)
+        group_results = [responses.get(f"{job_id}:{group_index}", []) for group_index in range(len(groups))]
+        results[job_id] = _scatter_suggestions(all_bullets, groups, group_results)
+
+    return results
+
+
+def _normalize_skill(skill: str) -> str:
+    """Reduce a skill name to a comparison key, resolving common aliases."""
+    key = SKILL_NOISE_PATTERN.sub('', skill.lower()).strip('.')
+    return SKILL_ALIASES.get(key, key)
+
+
+def _index_skills(skills: List[str]) -> Dict[str, str]:
+    """Map each normalized skill key to its first spelling, in list order."""
+    index = {}
+    for skill in skills:
+        key = _normalize_skill(skill)
+        if key:
+            index.setdefault(key, skill.strip())
+    return index
+
+
+def _skills_related(key: str, other: str) -> bool:
+    """Whether two different normalized skill keys may name the same or overlapping skills."""
+    shorter, longer = sorted((key, other), key=len)
+    if len(shorter) >= SKILL_CONTAINMENT_MIN_LENGTH and shorter in longer:
+        return True
+    
+    matcher = SequenceMatcher(None, key, other)
+    return (
+        matcher.real_quick_ratio() >= SKILL_MATCH_CUTOFF
+        and matcher.quick_ratio() >= SKILL_MATCH_CUTOFF
+        and matcher.ratio() >= SKILL_MATCH_CUTOFF
+    )
+
 
 def suggest_skills(existing_skills: List[str], jd_skills: List[str]) -> Dict:
     """
     Suggest which skills to add, keep, or mark as optional based on job description.
     
-    Uses GPT to intelligently match existing skills with job requirements
-    and suggest additions.
+    Skills are matched locally after normalizing case, punctuation and
+    common aliases (e.g. "JS" and "JavaScript"), so no GPT call is made.
+    Use suggest_skills_llm() to have GPT also match related skills that
+    are named differently.
+    
+    Args:
+        existing_skills: List of skills currently in the resume
+        jd_skills: List of skills from job description analysis
+        
+    Returns:
+        Dictionary with:
+        {
+            "add": [JD skills missing from the resume, in JD order],
+            "keep": [resume skills the JD asks for, in resume order],
+            "optional": [other resume skills, in resume order]
+        }
+    """
+    resume = _index_skills(existing_skills)
+    jd = _index_skills(jd_skills)
+    
+    return {
+        "add": [skill for key, skill in jd.items() if key not in resume],
+        "keep": [skill for key, skill in resume.items() if key in jd],
+        "optional": [skill for key, skill in resume.items() if key not in jd]
+    }
+
+
+def suggest_skills_llm(existing_skills: List[str], jd_skills: List[str]) -> Dict:
+    """
+    Suggest which skills to add, keep, or mark as optional based on job description.
+    
+    Skills that match exactly after normalization are kept, and skills with
+    no similar name on the other side are added or marked optional, all
+    locally. Only the ambiguous remainder (similar but not identical names,
+    e.g. "SQL" and "PostgreSQL") is sent to GPT to classify; if there is
+    none, no GPT call is made.
     
     Args:
         existing_skills: List of skills currently in the resume
@@ -173,15 +718,51 @@ def suggest_skills(existing_skills: List[str], jd_skills: List[str]) -> Dict:
         }
         
     Raises:
-        ValueError: If OPENAI_API_KEY is not set
+        ValueError: If GPT is needed and OPENAI_API_KEY is not set or the
+            GPT call fails
     """
-    # Get API key from environment
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable is not set")
+    resume = _index_skills(existing_skills)
+    jd = _index_skills(jd_skills)
+    
+    unmatched_resume = [key for key in resume if key not in jd]
+    unmatched_jd = [key for key in jd if key not in resume]
+    ambiguous = {
+        (resume_key, jd_key)
+        for resume_key in unmatched_resume
+        for jd_key in unmatched_jd
+        if _skills_related(resume_key, jd_key)
+    }
+    ambiguous_resume = {resume_key for resume_key, _ in ambiguous}
+    ambiguous_jd = {jd_key for _, jd_key in ambiguous}
+    
+    result = {
+        "add": [jd[key] for key in unmatched_jd if key not in ambiguous_jd],
+        "keep": [skill for key, skill in resume.items() if key in jd],
+        "optional": [resume[key] for key in unmatched_resume if key not in ambiguous_resume]
+    }
+    if not ambiguous:
+        return result
     
-    # Initialize OpenAI client
-    client = OpenAI(api_key=api_key)
+    classified = _classify_skills_llm(
+        [resume[key] for key in unmatched_resume if key in ambiguous_resume],
+        [jd[key] for key in unmatched_jd if key in ambiguous_jd]
+    )
+    for field in result:
+        result[field].extend(classified[field])
+    
+    return result
+
+
+def _classify_skills_llm(existing_skills: List[str], jd_skills: List[str]) -> Dict:
+    """
+    Have GPT sort skills into "add", "keep" and "optional" lists.
+    
+    Identical requests are answered from the response cache.
+    
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set or the GPT call fails
+    """
+    client = _get_client()
     
     # Create prompt for GPT
     prompt = f"""Analyze the skills match between a resume and a job description.
@@ -206,35 +787,39 @@ Return a JSON object with this exact structure:
 
 Return only the JSON object, no markdown code blocks, no explanations."""
     
+    request = {
+        "model": SKILLS_MODEL,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a skills matching expert. Return only valid JSON objects. Do not hallucinate skills."
+            },
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0,
+        "response_format": {"type": "json_object"}
+    }
+    if SKILLS_SERVICE_TIER and (
+        SKILLS_SERVICE_TIER != "flex" or SKILLS_MODEL.startswith(FLEX_TIER_MODEL_PREFIXES)
+    ):
+        request["service_tier"] = SKILLS_SERVICE_TIER
+    cache_key = _response_cache_key(request)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         # Call GPT API
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a skills matching expert. Return only valid JSON objects. Do not hallucinate skills."
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0,
-            response_format={"type": "json_object"}
-        )
+        response = _chat_create(client, request)
         
         # Extract JSON from response
         content = response.choices[0].message.content.strip()
         
         # Remove markdown code blocks if present
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
+        content = MARKDOWN_FENCE_PATTERN.sub('', content).strip()
         
         # Parse JSON
-        result = json.loads(content)
+        result = json_loads(content)
         
         # Ensure all required fields are present and are lists
         required_fields = ["add", "keep", "optional"]
@@ -244,10 +829,11 @@ Return only the JSON object, no markdown code blocks, no explanations."""
             elif not isinstance(result[field], list):
                 result[field] = []
         
-        return result
-        
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse GPT response as JSON: {str(e)}")
     except Exception as e:
         raise ValueError(f"Error calling OpenAI API: {str(e)}")
+    
+    _response_cache.put(cache_key, result)
+    return result
 